@@ -17,31 +17,39 @@ import os
 import sys
 from typing import List
 
-import bpy
+try:
+    import bpy
+except ImportError:
+    # Imported outside of Blender, as by the worker processes of
+    # utils.batch: only the bpy-free types and utils modules are
+    # usable then, and there is no add-on to register.
+    bpy = None
 
-from bpy.app import version_string
-from bpy.app.handlers import depsgraph_update_post
-from bpy.props import FloatVectorProperty
-from bpy.types import Context, KeyMap, Menu, PropertyGroup
+if bpy is not None:
+    from bpy.app import version_string
+    from bpy.app.handlers import depsgraph_update_post
+    from bpy.props import FloatVectorProperty
+    from bpy.types import Context, KeyMap, Menu, PropertyGroup
 
-from .addon_prefs import Prefs, GR2PREFS_MT_presets_menu, GR2PREFS_OT_set_preset
+    from .addon_prefs import Prefs, GR2PREFS_MT_presets_menu, GR2PREFS_OT_set_preset, GR2PREFS_OT_clear_cache
 
-from .ops.export_gr2             import ExportGR2
-from .ops.export_gr2_32          import ExportGR2_32
-from .ops.import_gr2             import ImportGR2
-from .ops.import_cha             import ImportCHA
-from .ops.import_clo             import ImportCLO
-from .ops.import_jba             import ImportJBA
+    from .ops.export_gr2             import ExportGR2
+    from .ops.export_gr2_32          import ExportGR2_32
+    from .ops.import_gr2             import ImportGR2
+    from .ops.import_gr2_directory   import ImportGR2Directory
+    from .ops.import_cha             import ImportCHA
+    from .ops.import_clo             import ImportCLO
+    from .ops.import_jba             import ImportJBA
 
-from .types.node        import ShaderNodeHeroEngine, NODE_OT_ngroup_edit
+    from .types.node        import ShaderNodeHeroEngine, NODE_OT_ngroup_edit
 
-# Detect Blender version
-major, minor, _ = bpy.app.version
-blender_version = float(f"{major}.{minor}")
+    # Detect Blender version
+    major, minor, _ = bpy.app.version
+    blender_version = float(f"{major}.{minor}")
 
 
-if blender_version >= 4.0:
-    from .ops.add_swtor_shaders_menu import *  # classes and fn for Shader Editor's Add menu functionality in 4.x
+    if blender_version >= 4.0:
+        from .ops.add_swtor_shaders_menu import *  # classes and fn for Shader Editor's Add menu functionality in 4.x
 
 
 
@@ -67,11 +75,14 @@ if module:
 
 
 # Clear out any scene update funcs hanging around, e.g. after a script reload
-for func in depsgraph_update_post:
-    if func.__module__.startswith(__name__):
-        depsgraph_update_post.remove(func)
+if bpy is not None:
+    for func in depsgraph_update_post:
+        if func.__module__.startswith(__name__):
+            depsgraph_update_post.remove(func)
+
+    del depsgraph_update_post
 
-del importlib, os, sys, depsgraph_update_post
+del importlib, os, sys
 
 
 # Import/Export functions to append to Import/Export menus in register()
@@ -82,6 +93,10 @@ def _import_gr2(self, _context):
     # type: (Menu, Context) -> None
     self.layout.operator(ImportGR2.bl_idname, text="SWTOR Objects and Skeletons (.gr2 32/64-bit)")
 
+def _import_gr2_directory(self, _context):
+    # type: (Menu, Context) -> None
+    self.layout.operator(ImportGR2Directory.bl_idname, text="SWTOR Objects and Skeletons in a Folder (.gr2 32/64-bit)")
+
 def _import_jba(self, _context):
     # type: (Menu, Context) -> None
     self.layout.operator(ImportJBA.bl_idname, text="SWTOR Animations (.jba 32-bit)")
@@ -105,26 +120,28 @@ def _export_gr2_32(self, _context):
     self.layout.operator(ExportGR2_32.bl_idname, text="SWTOR 32-bit Objects (.gr2) - DO NOT USE!  Read Tooltip")
 
 
-class BoneBounds(PropertyGroup):
-    bounds: FloatVectorProperty(default=[0.0] * 6, name="Bounds", precision=6, size=6)
+if bpy is not None:
+    class BoneBounds(PropertyGroup):
+        bounds: FloatVectorProperty(default=[0.0] * 6, name="Bounds", precision=6, size=6)
 
 
-classes = (
-    Prefs, GR2PREFS_MT_presets_menu, GR2PREFS_OT_set_preset,
-    BoneBounds,
-    ExportGR2,
-    ExportGR2_32,
-    ImportCHA,
-    ImportCLO,
-    ImportGR2,
-    ImportJBA,
-    ShaderNodeHeroEngine,
-    NODE_OT_ngroup_edit,
-)
-if blender_version >= 4.0:
-    classes = classes + (NODE_MT_add_swtor_shader, NODE_MT_swtor_shaders_menu)
+    classes = (
+        Prefs, GR2PREFS_MT_presets_menu, GR2PREFS_OT_set_preset, GR2PREFS_OT_clear_cache,
+        BoneBounds,
+        ExportGR2,
+        ExportGR2_32,
+        ImportCHA,
+        ImportCLO,
+        ImportGR2,
+        ImportGR2Directory,
+        ImportJBA,
+        ShaderNodeHeroEngine,
+        NODE_OT_ngroup_edit,
+    )
+    if blender_version >= 4.0:
+        classes = classes + (NODE_MT_add_swtor_shader, NODE_MT_swtor_shaders_menu)
 
-keymaps: List[KeyMap] = []
+    keymaps: List[KeyMap] = []
 
 
 def register():
@@ -139,6 +156,7 @@ def register():
     # Additions to Import-Export menu
     from bpy.types import TOPBAR_MT_file_export, TOPBAR_MT_file_import
     TOPBAR_MT_file_import.append(_import_gr2)
+    TOPBAR_MT_file_import.append(_import_gr2_directory)
     TOPBAR_MT_file_import.append(_import_jba)
     TOPBAR_MT_file_import.append(_import_cha)
     TOPBAR_MT_file_import.append(_import_clo)
@@ -207,6 +225,7 @@ def unregister():
     TOPBAR_MT_file_import.remove(_import_cha)
     TOPBAR_MT_file_import.remove(_import_clo)
     TOPBAR_MT_file_import.remove(_import_gr2)
+    TOPBAR_MT_file_import.remove(_import_gr2_directory)
     TOPBAR_MT_file_import.remove(_import_jba)
     TOPBAR_MT_file_export.remove(_export_gr2)
     TOPBAR_MT_file_export.remove(_export_gr2_32)
@@ -1,5 +1,10 @@
+import os
+
 import bpy
 
+from .utils.cache import ParseCache
+
+
 def update_jba_scale(self, context):
     '''
     update jba_scale_factor
@@ -54,6 +59,61 @@ class Prefs(bpy.types.AddonPreferences):
         default=False,
     )
 
+    gr2_material_policy: bpy.props.EnumProperty(
+        name="Materials",
+        description="What to do with the materials of an imported object whose .gr2 material names\nmatch those of materials created by earlier imports in this session",
+        items=[('NEW',   "Always New", "Create new materials for every imported object, as usual\n(repeated imports produce .001, .002… duplicates)"),
+               ('REUSE', "Reuse",      "Reuse the materials created by earlier imports for the same\n.gr2 material names instead of creating duplicates"),
+               ],
+        default='NEW',
+    )
+
+    gr2_reuse_meshes: bpy.props.BoolProperty(
+        name="Reuse Meshes",
+        description="Objects from .gr2 files that were already imported in this session\nwith the same geometry-changing settings share their mesh data\n(as linked duplicates) instead of being parsed and built again.\n\nSaves memory and time when importing several characters\nsharing gear, or areas with many repeated props.\nEditing a shared mesh affects all of its objects",
+        default=False,
+    )
+
+    gr2_import_workers: bpy.props.IntProperty(
+        name="Parsing Processes",
+        description="Number of background processes that parse the files of a multiple\n.gr2 files selection in parallel, while Blender builds the objects\nin the original order.\n\n1 parses them one by one as usual, 0 uses all the CPU cores",
+        min = 0,
+        soft_max = 32,
+        default=1,
+    )
+
+    gr2_parse_cache: bpy.props.BoolProperty(
+        name="Parse Cache",
+        description="Keeps the parsed contents of imported .gr2 files in a cache on disk,\nso that importing them again skips reading and decoding them.\n\nFiles are recognized by their path, size, modification date and contents,\nso edited or re-extracted files are always parsed anew",
+        default=False,
+    )
+
+    gr2_cache_directory: bpy.props.StringProperty(
+        name="Cache Folder",
+        description="Folder holding the parse cache.\nIf left empty, a folder in Blender's user data folder is used",
+        subtype='DIR_PATH',
+        default="",
+    )
+
+    gr2_cache_size: bpy.props.IntProperty(
+        name="Cache Size (MB)",
+        description="Maximum size of the parse cache in megabytes.\nOnce exceeded, the least recently used files are discarded from it",
+        min = 16,
+        soft_max = 16384,
+        default=1024,
+    )
+
+
+    def cache_directory(self):
+        # type: () -> str
+        if self.gr2_cache_directory:
+            return bpy.path.abspath(self.gr2_cache_directory)
+        return os.path.join(bpy.utils.user_resource('DATAFILES'), "io_scene_gr2_cache")
+
+    def parse_cache(self):
+        # type: () -> ParseCache
+        return ParseCache(self.cache_directory(), self.gr2_cache_size * 1024 * 1024)
+
 
     # .jba import ones:
 
@@ -110,6 +170,16 @@ class Prefs(bpy.types.AddonPreferences):
         slider_split.enabled = self.gr2_scale_object
         slider_split.label()
         slider_split.prop(self,'gr2_scale_factor', text="Scale factor")
+        boxcol.prop(self,'gr2_material_policy', text="Materials")
+        boxcol.prop(self,'gr2_reuse_meshes', text="Reuse Already Imported Meshes")
+        boxcol.prop(self,'gr2_import_workers', text="Parallel Parsing Processes")
+        boxcol.prop(self,'gr2_parse_cache', text="Cache Parsed Files On Disk")
+        cache_col = boxcol.column(align=True)
+        cache_col.enabled = self.gr2_parse_cache
+        cache_col.prop(self,'gr2_cache_directory', text="")
+        cache_split = cache_col.split(factor=0.6, align=True)
+        cache_split.prop(self,'gr2_cache_size', text="Size (MB)")
+        cache_split.operator('import_mesh.gr2_clear_cache', text="Clear Cache")
         
         boxcol = split_right.box().column(align=True, heading=".JBA ANIMATIONS IMPORT SETTINGS:")
         boxcol.scale_y = 0.90
@@ -196,11 +266,30 @@ class GR2PREFS_OT_set_preset(bpy.types.Operator):
             prefs.gr2_scale_object        = False
             prefs.gr2_scale_factor        = 1.0
             prefs.gr2_apply_axis_conversion  = False
+            prefs.gr2_material_policy     = 'NEW'
+            prefs.gr2_reuse_meshes        = False
+            prefs.gr2_parse_cache         = False
 
             prefs.jba_ignore_facial_bones = True
             prefs.jba_delete_180          = False
            
         return {"FINISHED"}
+
+
+class GR2PREFS_OT_clear_cache(bpy.types.Operator):
+    bl_idname = "import_mesh.gr2_clear_cache"
+    bl_label = "Clear .gr2 Parse Cache"
+    bl_options = {'REGISTER'}
+    bl_description = "Deletes all the parsed .gr2 files kept in the parse cache"
+
+    def execute(self, context):
+
+        prefs = context.preferences.addons["io_scene_gr2"].preferences
+
+        freed = prefs.parse_cache().clear()
+        self.report({'INFO'}, f"Parse cache cleared ({freed / 1048576:.1f} MB freed)")
+
+        return {"FINISHED"}
     
     
 
@@ -210,9 +299,11 @@ def register():
     bpy.utils.register_class(Prefs)
     bpy.utils.register_class(GR2PREFS_MT_presets_menu)
     bpy.utils.register_class(GR2PREFS_OT_set_preset)
+    bpy.utils.register_class(GR2PREFS_OT_clear_cache)
 
 
 def unregister():
+    bpy.utils.unregister_class(GR2PREFS_OT_clear_cache)
     bpy.utils.unregister_class(GR2PREFS_OT_set_preset)
     bpy.utils.unregister_class(GR2PREFS_MT_presets_menu)
     bpy.utils.unregister_class(Prefs)
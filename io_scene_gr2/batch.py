@@ -0,0 +1,182 @@
+# <pep8 compliant>
+
+"""
+Headless batch conversion of an extracted SWTOR resources tree.
+
+Walks a directory for .gr2 files, parses each of them in a pool of worker
+processes and pickles the resulting Granny2 objects (meshes already decoded,
+collision meshes left out unless asked for) to an output directory mirroring
+the input tree, where an import can load them without parsing again. Runs both
+in Blender and in plain Python, as parsing needs no bpy:
+
+    blender -b --python io_scene_gr2/batch.py -- <resources> <output> [options]
+    python -m io_scene_gr2.batch <resources> <output> [options]
+
+Every converted or failed file is appended to a journal.jsonl in the output
+directory as soon as it is done, so that an interrupted run resumes where it
+stopped. A summary.json of the run's throughput and of all the failures is
+written at the end.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from functools import partial
+from typing import Dict, Iterator, List, Optional
+
+if not __package__:
+    # Run as a script (blender --python), or re-run as such by a spawned
+    # worker process: make the package importable.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = "io_scene_gr2"
+
+from .utils.batch import convert_file, process_pool
+
+
+JOURNAL_NAME = "journal.jsonl"
+SUMMARY_NAME = "summary.json"
+
+
+def find_files(root):
+    # type: (str) -> Iterator[str]
+    """
+    Yields the paths of all .gr2 files under root, relative to it, in a stable
+    (sorted) order.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.lower().endswith(".gr2"):
+                yield os.path.relpath(os.path.join(dirpath, filename), root)
+
+
+def read_journal(journal_path):
+    # type: (str) -> Dict[str, dict]
+    """
+    Returns the latest journal record of every file converted (or failed) by
+    earlier runs, keyed by relative path. A line truncated by an interruption
+    is ignored, so that file is converted again.
+    """
+    records = {}
+    if os.path.isfile(journal_path):
+        with open(journal_path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                records[record["path"]] = record
+    return records
+
+
+def convert(root, output, workers=0, retry_failed=False, import_collision=False, log=print):
+    # type: (str, str, int, bool, bool, callable) -> dict
+    """
+    Converts every .gr2 file under root not already in output's journal (nor
+    failed, unless retry_failed) and writes the run's summary.
+
+    :param workers: Number of worker processes. 0 uses all the CPU cores,
+    1 converts the files one by one in this process.
+    :param import_collision: Whether to keep the files' collision meshes.
+    :return: The summary, as written to summary.json.
+    """
+    os.makedirs(output, exist_ok=True)
+    journal_path = os.path.join(output, JOURNAL_NAME)
+    records = read_journal(journal_path)
+
+    paths = []
+    skipped = 0
+    for path in find_files(root):
+        if path not in records or (retry_failed and records[path]["status"] != "ok"):
+            paths.append(path)
+        else:
+            skipped += 1
+    log(f"{len(paths)} .gr2 files to convert, {skipped} already done.")
+
+    sources = [os.path.join(root, path) for path in paths]
+    targets = [os.path.join(output, path) + ".pickle" for path in paths]
+    workers = workers or os.cpu_count() or 1
+
+    start_time = time.perf_counter()
+    converted = failed = total_bytes = 0
+
+    with open(journal_path, "a", encoding="utf-8") as journal:
+        if workers == 1:
+            results = map(partial(convert_file, import_collision=import_collision), sources, targets)
+            executor = None
+        else:
+            executor = process_pool(workers)
+            results = executor.map(partial(convert_file, import_collision=import_collision),
+                                   sources, targets, chunksize=16)
+
+        try:
+            for path, record in zip(paths, results):
+                record["path"] = path
+                records[path] = record
+                journal.write(json.dumps(record) + "\n")
+                journal.flush()
+
+                if record["status"] == "ok":
+                    converted += 1
+                    total_bytes += record["bytes"]
+                else:
+                    failed += 1
+                    log(f"{path}: {record['error']}")
+
+                done = converted + failed
+                if done % 1000 == 0:
+                    log(f"{done} / {len(paths)} files converted.")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    seconds = time.perf_counter() - start_time
+    summary = {
+        "root": os.path.abspath(root),
+        "workers": workers,
+        "files": len(records),
+        "converted": converted,
+        "failed": failed,
+        "skipped": skipped,
+        "seconds": round(seconds, 3),
+        "files_per_second": round(converted / seconds, 2) if seconds else 0.0,
+        "megabytes_per_second": round(total_bytes / seconds / 1048576, 2) if seconds else 0.0,
+        "failures": {path: record["error"] for path, record in sorted(records.items())
+                     if record["status"] != "ok"},
+    }
+    with open(os.path.join(output, SUMMARY_NAME), "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=4)
+
+    log(f"{converted} files converted, {failed} failed, in {seconds:.1f} s "
+        f"({summary['files_per_second']} files/s).")
+    return summary
+
+
+def main(argv=None):
+    # type: (Optional[List[str]]) -> int
+    if argv is None:
+        # Blender passes the script's own arguments after a "--".
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        prog="io_scene_gr2.batch",
+        description="Converts all the .gr2 files of an extracted SWTOR resources tree "
+                    "into pickled intermediates, resuming interrupted runs.")
+    parser.add_argument("root", help="Resources directory to search for .gr2 files")
+    parser.add_argument("output", help="Directory for the intermediates, journal and summary")
+    parser.add_argument("-w", "--workers", type=int, default=0,
+                        help="Number of worker processes (default: 0, all the CPU cores)")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Convert again the files that failed in earlier runs")
+    parser.add_argument("--collision", action="store_true",
+                        help="Keep the files' collision meshes, left out by default")
+    args = parser.parse_args(argv)
+
+    summary = convert(args.root, args.output, max(args.workers, 0), args.retry_failed, args.collision)
+    return 1 if summary["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,17 +10,18 @@ https://github.com/SWTOR-Slicers/WikiPedia/wiki/GR2-File-Structure
 """
 
 import os
+from array import array
 from typing import List, Optional, Set
 
 import bpy
 from bpy.props import BoolProperty, StringProperty
 from bpy.types import Context, Object, Operator, Mesh
 from bpy_extras.io_utils import ExportHelper, axis_conversion, orientation_helper
-from mathutils import Matrix, Vector
+from mathutils import Matrix
 
 from ..types.gr2 import Granny2
 from ..utils.binary import ArrayBuffer, DataView
-from ..utils.number import encodeHalfFloat
+from ..utils.vertex import encode_vertex_buffer
 
 
 @orientation_helper(axis_forward='-Z', axis_up='Y')
@@ -123,22 +124,20 @@ def parse(ob, mesh, has_clo=False):
                              for i, name in enumerate(ob.vertex_groups.keys())}
 
     # Parse mesh vertices
-    gmesh.vertex_buffer = {}
+    num_vertices = len(mesh.vertices)
+    vertex_buffer = Granny2.VertexBuffer(
+        array('f', [0.0] * (num_vertices * 3)),
+        normals=array('B', [127, 127, 127, 255] * num_vertices),
+        tangents=array('B', [127, 127, 127, 0] * num_vertices),
+        uv_layers=[array('f', [0.0] * (num_vertices * 2))])
 
-    for i in range(len(mesh.loops)):
-        if gmesh.vertex_buffer.get(mesh.loops[i].vertex_index, False):
-            continue
-
-        loop = mesh.loops[i]
-        vert = mesh.vertices[loop.vertex_index]
-
-        pos = vert.co
-        nor = loop.normal
-        tan = loop.tangent
-        bit = loop.bitangent_sign
-        tex = mesh.uv_layers.active.data[i].uv
+    if gmesh.bone_buffer:
+        vertex_buffer.bone_weights = array('B', [0] * (num_vertices * 4))
+        vertex_buffer.bone_indices = array('B', [0] * (num_vertices * 4))
 
-        vertex = Granny2.Vertex(pos)
+    for vert in mesh.vertices:
+        i = vert.index
+        vertex_buffer.positions[i * 3:i * 3 + 3] = array('f', vert.co)
 
         if gmesh.bone_buffer:
             groups = sorted([(g.group, g.weight) for g in vert.groups],
@@ -149,19 +148,32 @@ def parse(ob, mesh, has_clo=False):
                 groups = groups[:4]
             else:
                 for _ in range(4 - len(groups)):
-                    groups.append((groups[0][0] if groups else 0.0, 0.0))
+                    groups.append((groups[0][0] if groups else 0, 0.0))
+
+            vertex_buffer.bone_indices[i * 4:i * 4 + 4] = array('B', [groups[j][0] for j in range(4)])
+            vertex_buffer.bone_weights[i * 4:i * 4 + 4] = array('B', [int(groups[j][1] * 255) for j in range(4)])
+
+    # Normals, tangents and UVs are taken from the first loop using each vertex.
+    parsed = set()
+    uvs = mesh.uv_layers.active.data
+
+    for loop in mesh.loops:
+        i = loop.vertex_index
+        if i in parsed:
+            continue
+        parsed.add(i)
 
-            vertex.bone_indices = Vector([groups[j][0] for j in range(4)])
-            vertex.bone_weights = Vector([groups[j][1] for j in range(4)])
+        vertex_buffer.normals[i * 4:i * 4 + 3] = array('B', [int((co * 127) + 127) for co in loop.normal])
+        vertex_buffer.tangents[i * 4:i * 4 + 3] = array('B', [int((co * 127) + 127) for co in loop.tangent])
+        vertex_buffer.tangents[i * 4 + 3] = 255 if loop.bitangent_sign == -1.0 else 0
 
-        vertex.normals = Vector(nor[:3] + (1.0,))
-        vertex.tangents = Vector(tan[:3] + (-bit,))
-        vertex.uv_layer0 = Vector(tex[:2])
+        tex = uvs[loop.index].uv
+        vertex_buffer.uv_layers[0][i * 2:i * 2 + 2] = array('f', (tex[0], 1 - tex[1]))
 
-        gmesh.vertex_buffer[vert.index] = vertex
+    gmesh.vertex_buffer = vertex_buffer
 
     # Parse mesh indices
-    gmesh.indices_buffer = {poly.index: tuple(poly.vertices) for poly in mesh.polygons}
+    gmesh.indices_buffer = array('H', [index for poly in mesh.polygons for index in poly.vertices])
 
     # Type Flag
     gr2.type_flag = 1 if has_clo else 0
@@ -344,41 +356,8 @@ def write(gr2, path):
 
     # Vertices buffer
     for mesh in gr2.mesh_buffer.values():
-        for vertex in mesh.vertex_buffer.values():
-            dv.setFloat32(pos, vertex.position.x, 1)
-            pos += 4
-            dv.setFloat32(pos, vertex.position.y, 1)
-            pos += 4
-            dv.setFloat32(pos, vertex.position.z, 1)
-            pos += 4
-
-            if hasattr(vertex, "bone_indices") and hasattr(vertex, "bone_weights"):
-                for co in vertex.bone_weights:
-                    dv.setUint8(pos, int(co * 255))
-                    pos += 1
-
-                for co in vertex.bone_indices:
-                    dv.setUint8(pos, int(co))
-                    pos += 1
-
-            for co in vertex.normals[:3]:
-                dv.setUint8(pos, int((co * 127) + 127))
-                pos += 1
-
-            dv.setUint8(pos, 255)
-            pos += 1
-
-            for co in vertex.tangents[:3]:
-                dv.setUint8(pos, int((co * 127) + 127))
-                pos += 1
-
-            dv.setUint8(pos, 255 if vertex.tangents[3] == 1.0 else 0)
-            pos += 1
-
-            dv.setUint16(pos, encodeHalfFloat(vertex.uv_layer0.x), 1)
-            pos += 2
-            dv.setUint16(pos, encodeHalfFloat(1 - vertex.uv_layer0.y), 1)
-            pos += 2
+        encode_vertex_buffer(dv, pos, mesh.vertex_buffer.to_columns(), mesh.bit_flag2, mesh.vertex_size)
+        pos += mesh.vertex_size * mesh.num_vertices
 
     # Zero padding
     while (pos % 16) != 0:
@@ -387,10 +366,8 @@ def write(gr2, path):
 
     # Indices buffer
     for mesh in gr2.mesh_buffer.values():
-        for polygon in mesh.indices_buffer.values():
-            for vertex_index in polygon:
-                dv.setUint16(pos, int(vertex_index), 1)
-                pos += 2
+        dv.setUint16Array(pos, mesh.indices_buffer, 1)
+        pos += len(mesh.indices_buffer) * 2
 
     # Zero padding
     while (pos % 16) != 0:
@@ -420,10 +397,11 @@ def write(gr2, path):
                     pos += 4
 
                 else:
-                    vertices = [v for v in mesh.vertex_buffer.values() if i in v.bone_indices]
-                    x_bounds = [vertex.position.x for vertex in vertices] if vertices else [0]
-                    y_bounds = [vertex.position.y for vertex in vertices] if vertices else [0]
-                    z_bounds = [vertex.position.z for vertex in vertices] if vertices else [0]
+                    vertex_buffer = mesh.vertex_buffer
+                    vertices = [j for j in range(len(vertex_buffer)) if i in vertex_buffer.bone_indices[j * 4:j * 4 + 4]]
+                    x_bounds = [vertex_buffer.positions[j * 3] for j in vertices] if vertices else [0]
+                    y_bounds = [vertex_buffer.positions[j * 3 + 1] for j in vertices] if vertices else [0]
+                    z_bounds = [vertex_buffer.positions[j * 3 + 2] for j in vertices] if vertices else [0]
 
                     dv.setFloat32(pos, min(x_bounds), 1)
                     pos += 4
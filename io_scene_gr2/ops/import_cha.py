@@ -22,8 +22,10 @@ from bpy_extras.io_utils import ImportHelper
 
 
 from .import_gr2 import load as ImportGR2_load  # .gr2 importing function used by this module 
+from .import_gr2 import import_options, parse_cache
 
 
+from ..utils.batch import prefetch_files
 from ..utils.string import path_format, path_split
 
 from ..types.shared import job_results  # add-on-wide global-like dict
@@ -375,6 +377,11 @@ def build(operator, context, slots, skin_mats,
 
 
 
+    # The next models are read and parsed in the background
+    # while the current one is being built and textured
+    parsed_models = prefetch_files([model for slot in slots for model in slot["models"]],
+                                   cache=parse_cache(), import_collision=import_options(operator)["import_collision"])
+
     for slot in slots:
         print()
         print()
@@ -385,7 +392,9 @@ def build(operator, context, slots, skin_mats,
             # read parameters from this module's class'
             # properties via the operator param (it
             # carries the class' self.)
-            ImportGR2_load(operator, context, model)
+            # (Invalid files are left for it to report.)
+            _, gr2 = next(parsed_models)
+            ImportGR2_load(operator, context, model, gr2=None if isinstance(gr2, ValueError) else gr2)
             
             name = path_split(model)[:-4]
 
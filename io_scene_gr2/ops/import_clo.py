@@ -18,7 +18,7 @@ from bpy.types import Context, Object, Operator, OperatorFileListElement
 from bpy_extras.io_utils import ImportHelper
 
 from ..types.clo import Cloth
-from ..utils.binary import ArrayBuffer, DataView
+from ..utils.binary import DataView, MappedBuffer
 
 
 class ImportCLO(Operator, ImportHelper):
@@ -61,11 +61,7 @@ class ImportCLO(Operator, ImportHelper):
 
 def read(operator, filepath):
     # type: (Operator, str) -> Optional[Cloth]
-    with open(filepath, 'rb') as file:
-        buffer = ArrayBuffer()
-        buffer.fromfile(file, os.path.getsize(filepath))
-
-    dv = DataView(buffer)
+    dv = DataView(MappedBuffer(filepath))
     pos = 0
 
     if dv.getUint32(pos, True) != 0x42434C4F:  # b'OLCB'
@@ -96,14 +92,14 @@ def read(operator, filepath):
 
     # unk2 = round(dv.getFloat32(pos, True))
     pos += 4
-    unk3 = [round(dv.getFloat32(pos + (i * 4), True)) for i in range(3)]
+    unk3 = [round(value) for value in dv.getFloat32Array(pos, 3, True)]
     pos += 12
 
     assert(unk3.count(0) == 3)
 
     # unk4 = round(dv.getFloat32(pos, True))
     pos += 4
-    unk5 = [round(dv.getFloat32(pos + (i * 4), True), 6) for i in range(4)]
+    unk5 = [round(value, 6) for value in dv.getFloat32Array(pos, 4, True)]
     pos += 16
 
     assert (unk5.count(-1) == 4)
@@ -142,16 +138,9 @@ def read(operator, filepath):
 
     # NOTE: Read bone names.
     pos = (pos + 127) & -128
-    names = []
-
-    for _ in range(num_bones_total):
-        name = ""
-
-        for _ in range(32):
-            name += chr(dv.getUint8(pos))
-            pos += 1
-
-        names.append(name.split('\0')[0])
+    raw_names = dv.getUint8Array(pos, num_bones_total * 32).tobytes()
+    pos += num_bones_total * 32
+    names = [raw_names[i:i + 32].decode('latin-1').split('\0')[0] for i in range(0, len(raw_names), 32)]
 
     for bone, name in zip(cloth.bones, names):
         bone.name = name
@@ -160,20 +149,16 @@ def read(operator, filepath):
     pos = offset_data + offset_bone_data1
 
     for _ in range(num_cloth_bones1):
-        constraints1 = [round(dv.getFloat32(pos + (i * 4), True), 6) for i in range(4)]
-        pos += 16
-        constraints2 = [round(dv.getFloat32(pos + (i * 4), True), 6) for i in range(6)]
-        pos += 24
-        constraints3 = [round(dv.getFloat32(pos + (i * 4), True), 6) for i in range(6)]
-        pos += 24
-        unk1 = [round(dv.getFloat32(pos + (i * 4), True), 6) for i in range(4)]
-        pos += 16
-        unk2 = [dv.getInt32(pos + (i * 4), True) for i in range(2)]
+        floats = [round(value, 6) for value in dv.getFloat32Array(pos, 20, True)]
+        constraints1 = floats[0:4]
+        constraints2 = floats[4:10]
+        constraints3 = floats[10:16]
+        unk1 = floats[16:20]
+        pos += 80
+        unk2 = dv.getInt32Array(pos, 2, True).tolist()
+        pos += 8
+        bone_index, parent_index = dv.getUint32Array(pos, 2, True)
         pos += 8
-        bone_index = dv.getUint32(pos, True)
-        pos += 4
-        parent_index = dv.getUint32(pos, True)
-        pos += 4
 
         bone = cloth.bones[bone_index]
         bone.index = bone_index
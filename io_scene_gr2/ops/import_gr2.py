@@ -21,24 +21,30 @@ class ImportJBA
 
 import json  # For dict-to-stringProperty translations 
 import os
+from array import array
 from math import pi as PI
 from tracemalloc import start
-from typing import Optional, Set
+from typing import List, Optional, Set
 import time
 
 import bpy
 from bpy import app
-from bpy.props import BoolProperty, CollectionProperty, FloatProperty, StringProperty
+from bpy.props import BoolProperty, CollectionProperty, EnumProperty, FloatProperty, StringProperty
 from bpy.types import Context, Operator, OperatorFileListElement
 # from bpy_extras.io_utils import ImportHelper
-from mathutils import Color, Matrix, Vector
+from mathutils import Matrix, Vector
 
 from ..types.gr2 import Granny2
-from ..utils.binary import ArrayBuffer, DataView
-from ..utils.number import decodeHalfFloat
-from ..utils.string import readString
+from ..utils.batch import parse_file, parse_files, prefetch_files
+from ..utils.cache import ParseCache, content_hash
+from ..utils.vertex import loop_uvs, vertex_normals
 
-from ..types.shared import job_results  # add-on-wide global-like dict
+from ..types.shared import job_results, material_registry, mesh_registry  # add-on-wide global-like dicts
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 BLENDER_VERSION = app.version
@@ -55,55 +61,10 @@ hook_bones = ['Camera',
               ]
 
 
-class ImportGR2(Operator):
+class ImportGR2Options:
     """
-    Import SWTOR GR2 file format (.gr2)
-    
-    Produces a file browser for manually
-    selecting one or multiple .gr2 object
-    files, including skeleton ones.
+    Import settings shared by the .gr2 importers (files and folder).
     """
-    bl_idname = "import_mesh.gr2"  # DO NOT CHANGE
-    bl_description = "Import SWTOR game objects and skeletons (armatures).\n\n• Compatible with both SWTOR 32 and 64-bit files\n   (before and after Game Update 7.2.1).\n\n• Can import selections of multiple files at once"
-    bl_label = "Import SWTOR (.gr2)"
-    bl_options = {'UNDO'}
-
-
-
-    # File Browser properties
-
-    # This class used to be based on ImportHelper
-    # but we now use invoke() to be able to use
-    # the Add-on's Preferences settings when
-    # called from the Import menu and launching
-    # a File Browser.
-    
-    # filepath is explicitly declared because
-    # omitting ImportHelper omits it, too.
-    # invoke() handles what to do if it is
-    # filled as a param in an external call.
-    
-    filepath: StringProperty(subtype='FILE_PATH')
-    
-    if BLENDER_VERSION < (2, 82, 0):
-        directory = StringProperty(subtype='DIR_PATH')
-    else:
-        directory: StringProperty(subtype='DIR_PATH')
-
-    filename_ext = ".gr2"
-
-    files: CollectionProperty(
-        name="File Path",
-        description="File path used for importing the GR2 file",
-        type=OperatorFileListElement,
-    )
-    
-    filter_glob: StringProperty(
-        default="*.gr2",
-        options={'HIDDEN'},
-    )
-
-
 
     # Importing parameters' properties
 
@@ -143,6 +104,21 @@ class ImportGR2(Operator):
         default=1.0,
     )
 
+    material_policy: EnumProperty(
+        name="Materials",
+        description="What to do with the materials of an imported object whose .gr2 material names\nmatch those of materials created by earlier imports in this session",
+        items=[('NEW',   "Always New", "Create new materials for every imported object, as usual\n(repeated imports produce .001, .002… duplicates)"),
+               ('REUSE', "Reuse",      "Reuse the materials created by earlier imports for the same\n.gr2 material names instead of creating duplicates"),
+               ],
+        default='NEW',
+    )
+
+    reuse_meshes: BoolProperty(
+        name="Reuse Meshes",
+        description="Objects from .gr2 files that were already imported in this session\nwith the same geometry-changing settings share their mesh data\n(as linked duplicates) instead of being parsed and built again.\n\nSaves memory and time when importing several characters\nsharing gear, or areas with many repeated props.\nEditing a shared mesh affects all of its objects",
+        default=False,
+    )
+
     enforce_neutral_settings: BoolProperty(
         name="Enforce Neutral Settings",
         description="Temporarily overrides this Add-on's settings\with those of older versions for compatibility with older tools",
@@ -166,22 +142,83 @@ class ImportGR2(Operator):
 
 
 
-    def invoke(self, context, event):
-        # To be able to set the class' properties to the values in the
-        # Add-on's preferences and show them in the File Browser's options,
-        # we use an Invoke function instead of directly using ImportHelper in
-        # the class definition, to be able to put there the required code.              
-        
+    def options_from_prefs(self, context):
+        # type: (Context) -> None
+        """
+        Sets the import settings to the Add-on's preferences' values,
+        so that the File Browser shows them.
+        """
         prefs = context.preferences.addons["io_scene_gr2"].preferences
-        
+
         self.import_collision       = prefs.gr2_import_collision
         self.name_as_filename       = prefs.gr2_name_as_filename
         self.apply_axis_conversion  = prefs.gr2_apply_axis_conversion
         self.scale_object           = prefs.gr2_scale_object
         self.scale_factor           = prefs.gr2_scale_factor
+        self.material_policy        = prefs.gr2_material_policy
+        self.reuse_meshes           = prefs.gr2_reuse_meshes
         self.job_results_rich       = False
         self.job_results_accumulate = False
 
+
+class ImportGR2(Operator, ImportGR2Options):
+    """
+    Import SWTOR GR2 file format (.gr2)
+    
+    Produces a file browser for manually
+    selecting one or multiple .gr2 object
+    files, including skeleton ones.
+    """
+    bl_idname = "import_mesh.gr2"  # DO NOT CHANGE
+    bl_description = "Import SWTOR game objects and skeletons (armatures).\n\n• Compatible with both SWTOR 32 and 64-bit files\n   (before and after Game Update 7.2.1).\n\n• Can import selections of multiple files at once"
+    bl_label = "Import SWTOR (.gr2)"
+    bl_options = {'UNDO'}
+
+
+
+    # File Browser properties
+
+    # This class used to be based on ImportHelper
+    # but we now use invoke() to be able to use
+    # the Add-on's Preferences settings when
+    # called from the Import menu and launching
+    # a File Browser.
+    
+    # filepath is explicitly declared because
+    # omitting ImportHelper omits it, too.
+    # invoke() handles what to do if it is
+    # filled as a param in an external call.
+    
+    filepath: StringProperty(subtype='FILE_PATH')
+    
+    if BLENDER_VERSION < (2, 82, 0):
+        directory = StringProperty(subtype='DIR_PATH')
+    else:
+        directory: StringProperty(subtype='DIR_PATH')
+
+    filename_ext = ".gr2"
+
+    files: CollectionProperty(
+        name="File Path",
+        description="File path used for importing the GR2 file",
+        type=OperatorFileListElement,
+    )
+    
+    filter_glob: StringProperty(
+        default="*.gr2",
+        options={'HIDDEN'},
+    )
+
+
+
+    def invoke(self, context, event):
+        # To be able to set the class' properties to the values in the
+        # Add-on's preferences and show them in the File Browser's options,
+        # we use an Invoke function instead of directly using ImportHelper in
+        # the class definition, to be able to put there the required code.              
+        
+        self.options_from_prefs(context)
+
         # Handling of filepath in case of being
         # filled as a param in an external call.
         if not self.filepath:
@@ -219,264 +256,90 @@ class ImportGR2(Operator):
 
         print()
 
-        for path in paths:
-            if not load(self, context, path):
-                return {'CANCELLED'}
+        # With several files, they are parsed by a pool of worker
+        # processes, or else ahead of time by a background thread,
+        # while they are built here in order
+        prefs = context.preferences.addons["io_scene_gr2"].preferences
+        import_collision = import_options(self)["import_collision"]
+        if len(paths) > 1 and prefs.gr2_import_workers != 1:
+            parsed_files = parse_files(paths, prefs.gr2_import_workers, parse_cache(), import_collision)
+        elif len(paths) > 1:
+            parsed_files = prefetch_files(paths, cache=parse_cache(), import_collision=import_collision)
+        else:
+            parsed_files = ((path, None) for path in paths)
+
+        try:
+            for path, gr2 in parsed_files:
+                if isinstance(gr2, ValueError):
+                    self.report({'ERROR'}, str(gr2))
+                    return {'CANCELLED'}
+                if not load(self, context, path, gr2=gr2):
+                    return {'CANCELLED'}
+        finally:
+            # Stops the parsing of the files left when cancelling
+            parsed_files.close()
 
         bpy.context.scene.io_scene_gr2_last_job = json.dumps(job_results)
 
         return {"FINISHED"}
 
 
-def read(operator, filepath):
-    # type: (Operator, str) -> Optional[Granny2]
-    with open(filepath, 'rb') as file:
-        buffer = ArrayBuffer()
-        buffer.fromfile(file, os.path.getsize(filepath))
-
-    dv = DataView(buffer)
-    pos = 0
-
-    # Cancel import if this is not a BioWare Austin / SWTOR GR2 file.
-    if dv.getUint32(pos, 1) != 0x42574147:
-        operator.report({'ERROR'}, f"{filepath} is not a valid SWTOR gr2 file.")
+def parse_cache():
+    # type: () -> Optional[ParseCache]
+    """
+    Returns the on-disk parse cache if it is enabled in the preferences.
+    """
+    prefs = bpy.context.preferences.addons["io_scene_gr2"].preferences
+    return prefs.parse_cache() if prefs.gr2_parse_cache else None
+
+
+def read(operator, filepath, import_collision=True):
+    # type: (Operator, str, bool) -> Optional[Granny2]
+    # Cancel import if this is not a BioWare Austin / SWTOR GR2 file,
+    # or if any of its sections lies outside of it.
+    cache = parse_cache()
+    try:
+        if cache is None:
+            return Granny2.read(filepath)
+        gr2 = parse_file(filepath, cache, import_collision)
+        if isinstance(gr2, ValueError):
+            raise gr2
+        return gr2
+    except ValueError as error:
+        operator.report({'ERROR'}, str(error))
         return None
 
-    gr2 = Granny2()
-
-    pos = 4
-
-    gr2.version = dv.getUint32(pos, 1)                   # GR2 file version
-
-
-    pos = 20  # 0x14, skipping the version numbers, magic numbers and collision offset
-
-    # GR2 file type, 0 = geometry, 1 = geometry with .clo file, 2 = skeleton
-    gr2.type_flag = dv.getUint32(pos, 1)
-    pos += 4
-    num_meshes = dv.getUint16(pos, 1)                    # Number of meshes in this file
-    pos += 2
-    num_materials = dv.getUint16(pos, 1)                 # Number of materials in this file
-    pos += 2
-    num_bones = dv.getUint16(pos, 1)                     # Number of bones in this file
-    pos += 2
-
-    pos += 18
-
-    # gr2.bounds = Granny2.BoundingBox([dv.getFloat32(pos + (i * 4), 1) for i in range(8)])
-    pos += 32
-
-
-
-    offset_mesh_header = None
-    offset_material_name_offsets = None
-    offset_bone_struct = None
-    # 0x50
-    # skipping offset CachedOffset as we don't use it
-    if gr2.version == 5:
-        pos += 8  # 0x54
-        offset_mesh_header = dv.getUint64(pos, 1)            # Mesh header offset address
-        pos += 8
-        offset_material_name_offsets = dv.getUint64(pos, 1)  # Material header offset address
-        pos += 8
-        offset_bone_struct = dv.getUint64(pos, 1)            # Bone structure offset address
-        pos += 8
-    else:	
-        pos += 4  # 0x54
-        offset_mesh_header = dv.getUint32(pos, 1)            # Mesh header offset address
-        pos += 4
-        offset_material_name_offsets = dv.getUint32(pos, 1)  # Material header offset address
-        pos += 4
-        offset_bone_struct = dv.getUint32(pos, 1)            # Bone structure offset address
-        pos += 4
 
+def bone_rest_matrices(gr2):
+    # type: (Granny2) -> List[Matrix]
+    """
+    Returns the armature space rest matrix of every skeleton bone, the inverse
+    of its (row-major, hence transposed) root_to_bone matrix. When NumPy is
+    available, all matrices are inverted in a single batch straight from the
+    file's bone_matrices column.
+    """
+    bones = list(gr2.bone_buffer.values())
+    matrices = getattr(gr2, "bone_matrices", None)
+    if np is not None and bones and matrices is not None:
+        root_to_bone = np.frombuffer(matrices, np.float32).astype(np.float64).reshape(-1, 4, 4)
+        return [Matrix(matrix) for matrix in np.linalg.inv(root_to_bone.transpose(0, 2, 1)).tolist()]
 
-    # Meshes
-    gr2.mesh_buffer = {}
-
-    mesh_bin_size = 40
-
-    if gr2.version == 5:
-        mesh_bin_size = 64
-
-    for i in range(num_meshes):
-        pos = offset_mesh_header + (i * mesh_bin_size)
-        # Mesh name
+    return [Matrix([bone.root_to_bone[j*4:j*4+4] for j in range(4)]).transposed().inverted() for bone in bones]
 
-        mesh = None
 
-        if gr2.version == 5:
-            mesh = Granny2.Mesh(readString(dv, pos, posOverride= dv.getUint64(pos, True)))
-            pos += 8
-        else:
-            mesh = Granny2.Mesh(readString(dv, pos))
-            pos += 4
-        
-        # operator.report({'INFO'}, f"Read the header for mesh {mesh.name}... {pos}")  # for diagnostics
-
-        # BitFlag1
-        pos += 4
-        # Number of sub meshes that make up this mesh
-        num_pieces = dv.getUint16(pos, 1)
-        pos += 2
-        # Number of bones used by this mesh
-        num_used_bones = dv.getUint16(pos, 1)
-        pos += 2
-        # BitFlag2
-
-        bit_flag2 = None
-        vertex_size = None
-
-        if gr2.version == 5:
-            bit_flag2 = dv.getUint32(pos, 1)
-            pos += 4
-            # 12 = collision, 24 = static, 32+ = dynamic
-            vertex_size = dv.getUint32(pos, 1)
-            pos += 4
-        else:
-            bit_flag2 = dv.getUint16(pos, 1)
-            pos += 2
-            # 12 = collision, 24 = static, 32+ = dynamic
-            vertex_size = dv.getUint16(pos, 1)
-            pos += 2
-
-        # Total number of vertices used by this mesh
-        num_vertices = dv.getUint32(pos, 1)
-        pos += 4
-        # Total number of polygons used by this mesh
-        num_polygons = dv.getUint32(pos, 1)
-        pos += 4
-
-        if gr2.version == 5:
-            # Offset of the vertices buffer for this mesh
-            mesh.offset_vertex_buffer = dv.getUint64(pos, 1)
-            pos += 8
-             # Offset of the sub mesh header(s)
-            mesh.offset_piece_headers = dv.getUint64(pos, 1)
-            pos += 8
-            # Offset of the indices buffer for this mesh
-            mesh.offset_indices_buffer = dv.getUint64(pos, 1)
-            pos += 8
-            # Offset of the bones buffer for this mesh
-            mesh.offset_bones_buffer = dv.getUint64(pos, 1)
-            pos += 8
-        else:
-            mesh.offset_vertex_buffer = dv.getUint32(pos, 1)
-            pos += 4
-            mesh.offset_piece_headers = dv.getUint32(pos, 1)
-            pos += 4
-            mesh.offset_indices_buffer = dv.getUint32(pos, 1)
-            pos += 4
-            mesh.offset_bones_buffer = dv.getUint32(pos, 1)
-            pos += 4
-
-        # Sub mesh header(s)
-        mesh.piece_header_buffer = {}
-        for j in range(num_pieces):
-            pos = mesh.offset_piece_headers + (j * 48)
-
-            piece = Granny2.Piece()
-
-            piece.offset_indices = dv.getUint32(pos, 1)     # Relative offset for this piece's faces
-            pos += 4
-            piece.num_polygons = dv.getUint32(pos, 1)       # Number of faces used by this piece
-            pos += 4
-            piece.material_index = dv.getUint32(pos, 1)     # Mesh piece material id
-            pos += 4
-            piece.index = dv.getUint32(pos, 1)              # Mesh piece enumerator (1 x uint32)
-            pos += 4
-            # piece.bounds = Granny2.BoundingBox(           # Bounding box (8 x 4 bytes)
-            #     [dv.getFloat32(pos + (k * 4), 1) for k in range(8)])
-            pos += 32
-
-            mesh.piece_header_buffer[j] = piece
-
-        # Vertex buffer
-        mesh.vertex_buffer = {}
-        for j in range(num_vertices):
-            pos = mesh.offset_vertex_buffer + (j * vertex_size)
-
-            vertex = Granny2.Vertex([dv.getFloat32(pos + (k * 4), 1) for k in range(3)])
-            pos += 12
-
-            if bit_flag2 & 256:  # 0x100
-                vertex.bone_weights = Vector([dv.getUint8(pos + k) for k in range(4)])
-                pos += 4
-                vertex.bone_indices = Vector([dv.getUint8(pos + k) for k in range(4)])
-                pos += 4
-
-            if bit_flag2 & 2:  # 0x02
-                vertex.normals = Vector(
-                    [(dv.getUint8(pos + k) - 127) / 127 for k in range(4)])
-                pos += 4
-                vertex.tangents = Vector(
-                    [(dv.getUint8(pos + k) - 127) / 127 for k in range(4)])
-                pos += 4
-
-            if bit_flag2 & 16:  # 0x10
-                vertex.color = Color([dv.getUint8(pos + k) for k in range(3)])
-                pos += 4
-
-            if bit_flag2 & 32:  # 0x20
-                vertex.uv_layer0 = Vector(
-                    [decodeHalfFloat(dv.getUint16(pos + (k * 2), 1)) for k in range(2)])
-                pos += 4
-
-            if bit_flag2 & 64:  # 0x40
-                vertex.uv_layer1 = Vector(
-                    [decodeHalfFloat(dv.getUint16(pos + (k * 2), 1)) for k in range(2)])
-                pos += 4
-
-            if bit_flag2 & 128:  # 0x80
-                vertex.uv_layer2 = Vector(
-                    [decodeHalfFloat(dv.getUint16(pos + (k * 2), 1)) for k in range(2)])
-
-            mesh.vertex_buffer[j] = vertex
-
-        # Indices buffer
-        mesh.indices_buffer = {}
-        for j in range(int(num_polygons / 3)):
-            pos = mesh.offset_indices_buffer + (j * 6)
-            mesh.indices_buffer[j] = tuple([dv.getUint16(pos + (k * 2), 1) for k in range(3)])
-
-        # Bone(s) buffer
-
-        boneSize = 32 if gr2.version == 5 else 28
-
-        mesh.bone_buffer = {j: Granny2.Bone(dv, mesh.offset_bones_buffer + (j * boneSize), gr2.version, True)
-                            for j in range(num_used_bones)}
-
-        gr2.mesh_buffer[i] = mesh
-
-    # Materials
-    # NOTE: I wish there was a more efficient way to do this!
-    gr2.material_names = {}
-    if num_materials:
-        pos = offset_material_name_offsets
-        for i in range(num_materials):
-
-            if gr2.version == 5:
-                gr2.material_names[i] = readString(dv, pos, posOverride=dv.getUint64(pos, 1))
-                pos += 8
-            else:
-                gr2.material_names[i] = readString(dv, pos)
-                pos += 4
-    else:
-        count = 0
-        for mesh in gr2.mesh_buffer.values():
-            if mesh.bit_flag2 & 32:
-                for j in mesh.piece_header_buffer.keys():  # Use "mesh name".00x for name
-                    gr2.material_names[count] = f"{mesh.name}.{j:03d}"
-                    count += 1
-
-    # Skeleton Bones
-
-    bone_size_of_mem = 144 if gr2.version == 5 else 136
+def registered_material(material_name):
+    # type: (str) -> Optional[bpy.types.Material]
+    """
+    Returns the material previously created for a .gr2 material name,
+    or None if there isn't one or it no longer exists.
+    """
+    material = bpy.data.materials.get(material_registry.get(material_name, ""))
+    if material and material.get("gr2_material_name") == material_name:
+        return material
 
-    gr2.bone_buffer = {i: Granny2.Bone(dv, offset_bone_struct + (i * bone_size_of_mem), gr2.version)
-                       for i in range(num_bones)}
+    material_registry.pop(material_name, None)
+    return None
 
-    return gr2
 
 def build(gr2,
           filepath="",
@@ -485,16 +348,33 @@ def build(gr2,
           scale_object          = None,
           scale_factor          = None,
           apply_axis_conversion = None,
+          material_policy       = 'NEW',
+          content_key           = None,
           ):
-    # type: (Granny2, str, bool, bool, bool, float, bool) -> None
+    # type: (Granny2, str, bool, bool, bool, float, bool, str, Optional[str]) -> None
 
     # Data that will be used for publishing results
     # via scene props to other add-ons
     resulting_single_mesh_blender_objects = []
+    last_object = None
+
+    # Mesh registry entry for reusing the meshes in later imports
+    registry_records = []
     
-    # NOTE: Create Materials
-    for i, material in gr2.material_names.items():
-        bpy.data.materials.new(name=material).use_nodes = True
+    # NOTE: Create Materials (or reuse the registered ones)
+    materials = {}
+    for i, material_name in gr2.material_names.items():
+        registered = registered_material(material_name)
+        if registered and material_policy == 'REUSE':
+            materials[i] = registered
+            continue
+
+        material = bpy.data.materials.new(name=material_name)
+        material.use_nodes = True
+        material["gr2_material_name"] = material_name
+        if not registered:
+            material_registry[material_name] = material.name
+        materials[i] = material
 
     # NOTE: Create Meshes
     for i, mesh in gr2.mesh_buffer.items():
@@ -510,138 +390,67 @@ def build(gr2,
         if "collision" in mesh.name and not import_collision:
             continue
 
+        vertex_buffer = mesh.vertex_buffer
+        indices = mesh.indices_buffer.tolist()
+
+        # Build the mesh straight from the decoded flat buffers rather than
+        # through from_pydata(), which needs per-vertex and per-face tuples.
+        num_polygons = len(indices) // 3
         blend_mesh = bpy.data.meshes.new(mesh.name)
-        blend_mesh.from_pydata([vert.position for vert in mesh.vertex_buffer.values()],
-                          [],
-                          [index for index in mesh.indices_buffer.values()])
+        blend_mesh.vertices.add(len(vertex_buffer))
+        blend_mesh.loops.add(num_polygons * 3)
+        blend_mesh.polygons.add(num_polygons)
+        blend_mesh.vertices.foreach_set("co", vertex_buffer.positions)
+        blend_mesh.loops.foreach_set("vertex_index", array('i', indices))
+        blend_mesh.polygons.foreach_set("loop_start", array('i', range(0, num_polygons * 3, 3)))
+        if BLENDER_VERSION < (4, 0, 0):
+            # loop_total is derived from loop_start in Blender 4.0+
+            blend_mesh.polygons.foreach_set("loop_total", array('i', [3]) * num_polygons)
+        if BLENDER_VERSION >= (4, 1, 0):
+            # Match from_pydata(), which marks every face as flat shaded
+            blend_mesh.shade_flat()
+        blend_mesh.update(calc_edges=True)
         
         if mesh.bit_flag2 & 32:  # 0x20
-            # Link Materials
-            material_indices = []
+            # Link Materials, run-length expanding each piece's material slot
+            # over its polygons (pieces are stored in index buffer order).
+            material_indices = array('i')
             for j, piece in mesh.piece_header_buffer.items():
-                material = gr2.material_names[j if piece.material_index == 4294967295 else piece.material_index]
-                blend_mesh.materials.append(bpy.data.materials[material])
+                blend_mesh.materials.append(materials[j if piece.material_index == 4294967295 else piece.material_index])
 
-                for _ in range(piece.num_polygons):
-                    material_indices.append(j)
+                material_indices.extend(array('i', [j]) * piece.num_polygons)
 
+            del material_indices[num_polygons:]
+            material_indices.extend(array('i', [0]) * (num_polygons - len(material_indices)))
+            blend_mesh.polygons.foreach_set("material_index", material_indices)
 
-        if BLENDER_VERSION < (4, 1, 0):
-            
-            if mesh.bit_flag2 & 2:   # 0x02
-                # NOTE: We store 'temp' normals in loops, since validate() may alter final mesh,
-                #       we can only set custom loop normals *after* calling it.
-                blend_mesh.create_normals_split()  # (DEPRECATED IN BLENDER 4.1)
-                    
-                # UV stuff
+        if mesh.bit_flag2 & 2:   # 0x02
+            # UV stuff
+            blend_mesh.uv_layers.new(do_init=False)
+            if mesh.bit_flag2 & 64:  # 0x40
                 blend_mesh.uv_layers.new(do_init=False)
-                if mesh.bit_flag2 & 64:  # 0x40
-                    blend_mesh.uv_layers.new(do_init=False)
-                if mesh.bit_flag2 & 128:  # 0x80
-                    blend_mesh.uv_layers.new(do_init=False)
-
-
-                for j, polygon in enumerate(blend_mesh.polygons):
-                    loop_indices = polygon.loop_indices
-
-                    for k, loop_index in enumerate(loop_indices):
-                        v = mesh.vertex_buffer[mesh.indices_buffer[j][k]]
-                        
-                        # We store the temp normals in each loop's normal attribute directly.
-                        # This, also, normalizes the normal vectors "for free".
-                        # (DEPRECATED IN BLENDER 4.1 where blend_mesh.loops[loop_index].normal is read-only)
-                        blend_mesh.loops[loop_index].normal = [v.normals.x, v.normals.y, v.normals.z]
-                        
-                        # UV stuff
-                        blend_mesh.uv_layers[0].data[loop_index].uv = [v.uv_layer0.x, 1 - v.uv_layer0.y]
-                        if mesh.bit_flag2 & 64:  # 0x40
-                            blend_mesh.uv_layers[1].data[loop_index].uv = [v.uv_layer1.x, 1 - v.uv_layer1.y]
-                        if mesh.bit_flag2 & 128:  # 0x80
-                            blend_mesh.uv_layers[2].data[loop_index].uv = [v.uv_layer2.x, 1 - v.uv_layer2.y]
-
-                    # Material stuff
-                    polygon.material_index = material_indices[j]
-
-                blend_mesh.validate(clean_customdata=False, verbose=True)
-
-                print("-" * 20)
-
-                # Retrieve the "validated" temp normals
-                custom_loop_normals = [0.0] * (len(blend_mesh.loops) * 3)                
-                blend_mesh.loops.foreach_get("normal", custom_loop_normals)
-                
-                # Apply them as split normals to the mesh
-                blend_mesh.polygons.foreach_set("use_smooth", [True] * len(blend_mesh.polygons))                
-                blend_mesh.normals_split_custom_set(
-                    tuple(zip(*(iter(custom_loop_normals),) * 3))
-                    )
-                blend_mesh.use_auto_smooth = True  # (DEPRECATED IN BLENDER 4.1)
-
-        else:
-            
-            if mesh.bit_flag2 & 2:   # 0x02
-                # NOTE: We store 'temp' normals in loops, since validate() may alter final mesh,
-                #       we can only set custom loop normals *after* calling it.
-                # We use a custom attribute to store them because we can't use
-                # the "normal" attribute: blend_mesh.loops[loop_index].normal is
-                # read-only in 4.1 and higher.
-                                                    
-                # UV stuff
+            if mesh.bit_flag2 & 128:  # 0x80
                 blend_mesh.uv_layers.new(do_init=False)
-                if mesh.bit_flag2 & 64:  # 0x40
-                    blend_mesh.uv_layers.new(do_init=False)
-                if mesh.bit_flag2 & 128:  # 0x80
-                    blend_mesh.uv_layers.new(do_init=False)
-
-                # For some reason, the creation of extra UV map layers for
-                # multiUvExtraction objects blitzes the temp normals custom attribute,
-                # so, we are creating it AFTER the creation of UV layers.
-                temp_custom_normals = blend_mesh.attributes.new(
-                    name="temp_custom_normals",
-                    type='FLOAT_VECTOR',
-                    domain='CORNER'
-                    ).data
-
-
-                for j, polygon in enumerate(blend_mesh.polygons):
-                    loop_indices = polygon.loop_indices
-
-                    for k, loop_index in enumerate(loop_indices):
-                        v = mesh.vertex_buffer[mesh.indices_buffer[j][k]]
-                        
-                        # We normalize the vectors because storing them in custom attributes
-                        # doesn't normalize them for free the way mesh.loops[loop_index].normal used to.
-                        # As we are using for the normals data the mathutils' Vector type,
-                        # we use its normalized() method (instead of normalize() which might be slower?).
-                        # blend_mesh.loops[loop_index].normal = [v.normals.x, v.normals.y, v.normals.z]
-
-                        # temp_custom_normals[loop_index].vector = v.normals.xyz.normalized()
-                        temp_custom_normals[loop_index].vector = v.normals.xyz.normalized()
-                                                
-                        # UV stuff
-                        blend_mesh.uv_layers[0].data[loop_index].uv = [v.uv_layer0.x, 1 - v.uv_layer0.y]
-                        if mesh.bit_flag2 & 64:  # 0x40
-                            blend_mesh.uv_layers[1].data[loop_index].uv = [v.uv_layer1.x, 1 - v.uv_layer1.y]
-                        if mesh.bit_flag2 & 128:  # 0x80
-                            blend_mesh.uv_layers[2].data[loop_index].uv = [v.uv_layer2.x, 1 - v.uv_layer2.y]
-
-                    # Material stuff
-                    polygon.material_index = material_indices[j]
-
-
-                blend_mesh.validate(clean_customdata=False)
-
-
-                # Retrieve the "validated" temp normals
-                custom_loop_normals = [0.0] * (len(blend_mesh.loops) * 3)
-                temp_custom_normals.foreach_get("vector", custom_loop_normals)
-                
-                # Apply them as split normals to the mesh
-                blend_mesh.polygons.foreach_set("use_smooth", [True] * len(blend_mesh.polygons))
-                blend_mesh.normals_split_custom_set(
-                    tuple(zip(*(iter(custom_loop_normals),) * 3))
-                    )
 
+            # UVs are written per loop in one go, gathered through the index buffer
+            for uv_layer, uvs in zip(blend_mesh.uv_layers, vertex_buffer.uv_layers):
+                uv_layer.data.foreach_set("uv", loop_uvs(uvs, indices))
+
+        # Only pay for a full validate() when the triangles have issues it must fix.
+        # The checks' results are recorded in the mesh's custom properties.
+        geometry_checks = mesh.check_indices()
+        blend_mesh["gr2_geometry_checks"] = geometry_checks
+        if any(geometry_checks.values()):
+            blend_mesh.validate(clean_customdata=False)
+
+        if mesh.bit_flag2 & 2:   # 0x02
+            # NOTE: Custom normals can only be set *after* validate(), as it may
+            #       alter the final mesh. validate() never removes vertices, so the
+            #       normals are applied per vertex and Blender spreads them to loops.
+            blend_mesh.polygons.foreach_set("use_smooth", [True] * len(blend_mesh.polygons))
+            blend_mesh.normals_split_custom_set_from_vertices(vertex_normals(vertex_buffer.normals))
+            if BLENDER_VERSION < (4, 1, 0):
+                blend_mesh.use_auto_smooth = True  # (DEPRECATED IN BLENDER 4.1)
 
 
         # Create Blender Object
@@ -667,174 +476,313 @@ def build(gr2,
             entry.bounds = bone.bounds
 
         # Populate Vertex Groups
-        for j, vertex in mesh.vertex_buffer.items():
-            if mesh.bit_flag2 & 256:
-                for index in range(4):
-                    bone = mesh.bone_buffer[vertex.bone_indices[index]].name
-                    ob.vertex_groups[bone].add([j], float(vertex.bone_weights[index] / 255), 'ADD')
+        if mesh.bit_flag2 & 256:
+            # Bucket vertices by (bone, uint8 weight) so that each bucket takes a
+            # single add() call. Influences of the same bone on a vertex are summed
+            # and zero weights are skipped. Groups are resolved by their index, as
+            # they were created in bone_buffer order above.
+            group_indices = {bone_index: i for i, bone_index in enumerate(mesh.bone_buffer)}
+            bone_indices = vertex_buffer.bone_indices.tolist()
+            bone_weights = vertex_buffer.bone_weights.tolist()
+            buckets = {}
+            for j in range(len(vertex_buffer)):
+                influences = {}
+                for index in range(j * 4, j * 4 + 4):
+                    if bone_weights[index]:
+                        bone = bone_indices[index]
+                        influences[bone] = influences.get(bone, 0) + bone_weights[index]
+                for bone, weight in influences.items():
+                    buckets.setdefault((bone, weight), []).append(j)
+
+            vertex_groups = ob.vertex_groups
+            for (bone, weight), vertices in buckets.items():
+                vertex_groups[group_indices[bone]].add(vertices, weight / 255, 'REPLACE')
 
         # Link Blender Object
         bpy.context.collection.objects.link(ob)
 
-        # Adjust the orientation of the model
-        ob.matrix_local = Matrix.Rotation(PI * 0.5, 4, 'X')
-
-        # Deselect all, then select imported model
-        bpy.ops.object.select_all(action='DESELECT')
-        ob.select_set(True)
-        bpy.context.view_layer.objects.active = ob
-        
-        # Apply transformation options and record them
-        # in custom object properties 
-        if scale_object or apply_axis_conversion:
+        # Adjust the orientation of the model and apply the transformation
+        # options straight to the mesh data, as transform_apply would, then
+        # record them in custom object properties
+        if apply_axis_conversion:
+            blend_mesh.transform(Matrix.Rotation(PI * 0.5, 4, 'X') @ Matrix.Scale(scale_factor if scale_object else 1.0, 4))
+        else:
+            ob.matrix_local = Matrix.Rotation(PI * 0.5, 4, 'X')
             if scale_object:
-                ob.scale *= scale_factor
-                
-            bpy.ops.object.transform_apply(location=False, rotation=apply_axis_conversion, scale=scale_object, properties=True)
-            
+                blend_mesh.transform(Matrix.Scale(scale_factor, 4))
+
         ob["gr2_scale"] = scale_factor
         ob["gr2_axis_conversion"] = apply_axis_conversion
-            
+
+        last_object = ob
+
+        if content_key:
+            blend_mesh["gr2_content_key"] = content_key
+            registry_records.append({'mesh':        blend_mesh.name,
+                                     'name':        mesh.name,
+                                     'main':        i == 0,
+                                     'groups':      [bone.name for bone in mesh.bone_buffer.values()],
+                                     'bone_bounds': [(bone.name, bone.bounds) for bone in mesh.bone_buffer.values()],
+                                     })
 
 
     # Create Armature
     if gr2.type_flag == 2 and len(gr2.bone_buffer) > 0:
-        bpy.ops.object.add(type='ARMATURE', enter_editmode=True)
-        armature: bpy.types.Armature = bpy.context.object.data
-        armature.name = filepath.split(os.sep)[-1][:-4]
+        # Edit Mode is entered on every selected armature, not just the active one
+        for selected_object in bpy.context.selected_objects:
+            selected_object.select_set(False)
+
+        armature: bpy.types.Armature = bpy.data.armatures.new(filepath.split(os.sep)[-1][:-4])
         armature.display_type = 'STICK'
 
-        # Bones creation
-        for bone in gr2.bone_buffer.values():
+        ob = bpy.data.objects.new(armature.name, armature)
+        bpy.context.collection.objects.link(ob)
+        ob.select_set(True)
+        bpy.context.view_layer.objects.active = ob
+
+        # Edit bones are only reachable in Edit Mode
+        bpy.ops.object.mode_set(mode='EDIT')
+
+        # Bones creation, placing each bone with its rest matrix
+        bones = list(gr2.bone_buffer.values())
+        edit_bones = []
+        for bone, matrix in zip(bones, bone_rest_matrices(gr2)):
             new_bone = armature.edit_bones.new(bone.name)
             new_bone.tail = [0, 0.00001, 0]
+            new_bone.transform(matrix)
+            edit_bones.append(new_bone)
 
         # Bones hierarchy organization
-        for i, bone in gr2.bone_buffer.items():
-            armature_bone = armature.edit_bones[i]
-
+        for bone, edit_bone in zip(bones, edit_bones):
             if bone.parent_index >= 0:
-                armature_bone.parent = armature.edit_bones[bone.parent_index]
+                edit_bone.parent = edit_bones[bone.parent_index]
 
-            matrix = Matrix([bone.root_to_bone[j*4:j*4+4] for j in range(4)])
-            # print(matrix, i , bone.name)  # for diagnostics
-            matrix.transpose()
-            armature_bone.transform(matrix.inverted())
+        bpy.ops.object.mode_set(mode='OBJECT')
 
-        bpy.context.object.name = armature.name
-        resulting_single_mesh_blender_objects.append(bpy.context.object.name)
+        resulting_single_mesh_blender_objects.append(ob.name)
 
-        bpy.context.object.matrix_local = Matrix.Rotation(PI * 0.5, 4, 'X')
-        
-        # Apply transformation options and record them
-        # in custom object properties 
-        if scale_object:
-            bpy.context.object.scale *= scale_factor
-            bpy.context.object["gr2_scale"] = scale_factor
+        # Adjust the orientation of the armature and apply the transformation
+        # options, baking them into the bones only along with the axis conversion,
+        # then record them in custom object properties
+        if apply_axis_conversion:
+            armature.transform(Matrix.Rotation(PI * 0.5, 4, 'X') @ Matrix.Scale(scale_factor if scale_object else 1.0, 4))
         else:
-            bpy.context.object["gr2_scale"] = 1.0
+            ob.matrix_local = Matrix.Rotation(PI * 0.5, 4, 'X')
+            if scale_object:
+                ob.scale *= scale_factor
 
-        bpy.ops.object.mode_set(mode='OBJECT')
+        ob["gr2_scale"] = scale_factor if scale_object else 1.0
+        ob["gr2_axis_conversion"] = apply_axis_conversion
 
-        if apply_axis_conversion:
-            bpy.ops.object.select_all(action='DESELECT')
-            ob=bpy.data.objects[armature.name]
-            ob.select_set(True)
-            bpy.context.view_layer.objects.active = ob
-            bpy.ops.object.transform_apply(location=False, rotation=True, scale=scale_object, properties=True )
-            ob["gr2_axis_conversion"] = True
+        last_object = ob
+
+    # Skeletons aren't reusable, so files holding one are never registered
+    if registry_records and not (gr2.type_flag == 2 and len(gr2.bone_buffer) > 0):
+        mesh_registry[content_key] = registry_records
+
+    # Deselect all, then select the last imported object, once per file
+    if last_object:
+        for selected_object in bpy.context.selected_objects:
+            selected_object.select_set(False)
+        last_object.select_set(True)
+        bpy.context.view_layer.objects.active = last_object
+
+    return resulting_single_mesh_blender_objects
+
+
+def mesh_content_key(filepath, import_collision, scale_object, scale_factor, apply_axis_conversion):
+    # type: (str, bool, bool, float, bool) -> str
+    """
+    Returns the mesh registry key of a .gr2 file: a hash of its contents
+    plus the import options that change the meshes built from it.
+    """
+    digest = content_hash(filepath)
+    return f"{digest}|{import_collision:d}|{scale_factor if scale_object else 1.0}|{apply_axis_conversion:d}"
+
+
+def link_registered_meshes(content_key,
+                           filepath="",
+                           import_collision      = None,
+                           name_as_filename      = None,
+                           scale_object          = None,
+                           scale_factor          = None,
+                           apply_axis_conversion = None,
+                           material_policy       = None,
+                           ):
+    # type: (str, str, bool, bool, bool, float, bool, str) -> Optional[List[str]]
+    """
+    Creates objects sharing the mesh data-blocks registered under content_key,
+    set up as build() would have done. Returns their names, or None if any of
+    those data-blocks is gone (the stale entry is dropped).
+    """
+    records = mesh_registry.get(content_key, [])
+    blend_meshes = [bpy.data.meshes.get(record['mesh']) for record in records]
+    if not records or not all(blend_mesh and blend_mesh.get("gr2_content_key") == content_key
+                              for blend_mesh in blend_meshes):
+        mesh_registry.pop(content_key, None)
+        return None
+
+    resulting_single_mesh_blender_objects = []
+
+    for record, blend_mesh in zip(records, blend_meshes):
+        if record['main'] and name_as_filename is True:
+            ob = bpy.data.objects.new(filepath.replace("\\", "/").split("/")[-1][:-4], blend_mesh)
         else:
-            ob=bpy.data.objects[armature.name]
-            ob["gr2_axis_conversion"] = False
+            ob = bpy.data.objects.new(record['name'], blend_mesh)
+
+        resulting_single_mesh_blender_objects.append(ob.name)
+
+        # Vertex weights live in the mesh, and so do the groups' names
+        # since Blender 3.0; older versions need them per object
+        if not ob.vertex_groups:
+            for name in record['groups']:
+                ob.vertex_groups.new(name=name)
+        for name, bounds in record['bone_bounds']:
+            entry = ob.bone_bounds.add()
+            entry.name = name
+            entry.bounds = bounds
+
+        # Link materials at the object level so that reassigning
+        # them (as the Character importer does) doesn't affect the
+        # other objects sharing this mesh
+        for material_slot, material in zip(ob.material_slots, blend_mesh.materials):
+            material_slot.link = 'OBJECT'
+            material_slot.material = material
+
+        bpy.context.collection.objects.link(ob)
+
+        # The transformation options are already applied to the mesh data
+        if not apply_axis_conversion:
+            ob.matrix_local = Matrix.Rotation(PI * 0.5, 4, 'X')
+
+        ob["gr2_scale"] = scale_factor
+        ob["gr2_axis_conversion"] = apply_axis_conversion
+
+    # Deselect all, then select the last imported object, once per file
+    for selected_object in bpy.context.selected_objects:
+        selected_object.select_set(False)
+    ob.select_set(True)
+    bpy.context.view_layer.objects.active = ob
 
-        
     return resulting_single_mesh_blender_objects
 
 
-def load(operator, context, filepath = ""):
-    # type: (Operator, Context, str) -> bool
+def import_options(operator):
+    # type: (Operator) -> dict
+    """
+    Returns the import settings that apply to the calling operator:
+    the neutral ones if enforced, those exposed in the File Browser
+    if invoked from the Import Menu, or else the preferences' ones.
+    """
+
+    if operator.enforce_neutral_settings:
+        return dict(import_collision      = False,
+                    name_as_filename      = False,
+                    scale_object          = False,
+                    scale_factor          = 1.0,
+                    apply_axis_conversion = False,
+                    material_policy       = 'NEW',
+                    reuse_meshes          = False,
+                    )
+    elif operator.bl_idname in ('IMPORT_MESH_OT_gr2', 'IMPORT_MESH_OT_gr2_directory') and operator.options.is_invoke:
+        # Called via Blender's Import Menu's Import .gr2 (or folder) option:
+        # use the possibly user-manually altered properties
+        # exposed in the File Browser.
+        # (operator was passed self.)
+        return dict(import_collision      = operator.import_collision,
+                    name_as_filename      = operator.name_as_filename,
+                    scale_object          = operator.scale_object,
+                    scale_factor          = operator.scale_factor,
+                    apply_axis_conversion = operator.apply_axis_conversion,
+                    material_policy       = operator.material_policy,
+                    reuse_meshes          = operator.reuse_meshes,
+                    )
+    else:
+        # Called via other Import Menu options (such as the
+        # .json Character importer) or code not from this Add-on:
+        # use the preferences' settings.
+        prefs = bpy.context.preferences.addons["io_scene_gr2"].preferences
+        return dict(import_collision      = prefs.gr2_import_collision,
+                    name_as_filename      = prefs.gr2_name_as_filename,
+                    scale_object          = prefs.gr2_scale_object,
+                    scale_factor          = prefs.gr2_scale_factor,
+                    apply_axis_conversion = prefs.gr2_apply_axis_conversion,
+                    material_policy       = prefs.gr2_material_policy,
+                    reuse_meshes          = prefs.gr2_reuse_meshes,
+                    )
+
+
+def load(operator, context, filepath = "", gr2 = None):
+    # type: (Operator, Context, str, Optional[Granny2]) -> bool
     """
     This is the operator called by all other tools (either in this Add-on
     or in other ones) for actual object importing operations. Externally,
     it is exposed as bpy.ops.import_mesh.gr2().
     
     The operator param is being passed the calling class' self.
+    The gr2 param can pass the file already parsed (e.g. by utils.batch).
     """
 
+    options = import_options(operator)
+
+    # Already built meshes section: a file imported before
+    # with the same geometry-changing options gets linked
+    # duplicates of its mesh data-blocks
+    content_key = None
+    objects_names = None
+    if options.pop("reuse_meshes"):
+        content_key = mesh_content_key(filepath,
+                                       import_collision      = options["import_collision"],
+                                       scale_object          = options["scale_object"],
+                                       scale_factor          = options["scale_factor"],
+                                       apply_axis_conversion = options["apply_axis_conversion"],
+                                       )
+        if content_key in mesh_registry:
+            print(f"FILE: {filepath} (reusing meshes)")
+            start_time = time.time()
+
+            if bpy.context.mode != 'OBJECT' and bpy.ops.object.mode_set.poll():
+                bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
+
+            objects_names = link_registered_meshes(content_key, filepath=filepath, **options)
+
     # .gr2 data parsing and mesh assembling section
-    mesh = read(operator, filepath=filepath)
-    
-    print(f"FILE: {filepath}")
+    if objects_names is None:
+        mesh = gr2 if gr2 is not None else read(operator, filepath=filepath, import_collision=options["import_collision"])
 
+        print(f"FILE: {filepath}")
 
-    # Blender object from mesh section
-    if mesh:
+        if not mesh:
+            return False
 
+        # Blender object from mesh section
         start_time = time.time()
         
-        if bpy.ops.object.mode_set.poll():
+        if bpy.context.mode != 'OBJECT' and bpy.ops.object.mode_set.poll():
             bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
 
-        if operator.enforce_neutral_settings:
-            objects_names = build(mesh,
-                                  filepath              = filepath,
-                                  import_collision      = False,
-                                  name_as_filename      = False,
-                                  scale_object          = False,
-                                  scale_factor          = 1.0,
-                                  apply_axis_conversion = False,
-                                  )
-        else:
-            if operator.bl_idname == 'IMPORT_MESH_OT_gr2' and operator.options.is_invoke:
-                # Called via Blender's Import Menu's Import .gr2 option:
-                # use the possibly user-manually altered properties
-                # exposed in the File Browser.
-                # (operator was passed self.)
-                objects_names = build(mesh,
-                                      filepath              = filepath,
-                                      import_collision      = operator.import_collision,
-                                      name_as_filename      = operator.name_as_filename,
-                                      scale_object          = operator.scale_object,
-                                      scale_factor          = operator.scale_factor,
-                                      apply_axis_conversion = operator.apply_axis_conversion,
-                                      )
-            else:
-                # Called via other Import Menu options (such as the
-                # .json Character importer) or code not from this Add-on:
-                # use the preferences' settings.
-                prefs = bpy.context.preferences.addons["io_scene_gr2"].preferences
-                objects_names = build(mesh,
-                                      filepath              = filepath,
-                                      import_collision      = prefs.gr2_import_collision,
-                                      name_as_filename      = prefs.gr2_name_as_filename,
-                                      scale_object          = prefs.gr2_scale_object,
-                                      scale_factor          = prefs.gr2_scale_factor,
-                                      apply_axis_conversion = prefs.gr2_apply_axis_conversion,
-                                      )
-
-        
-        # job_results-filling section
-        
-        job_results['job_origin'] = operator.bl_idname
+        objects_names = build(mesh, filepath=filepath, content_key=content_key, **options)
 
-        job_results['objs_names'].extend(objects_names)
+    # job_results-filling section
+    
+    job_results['job_origin'] = operator.bl_idname
 
-        if operator.job_results_rich:
-            if 'resources' in filepath:
-                job_results['files_objs_names'][ filepath.replace("\\", "/").partition("resources/")[2] ] = objects_names
-            else:
-                job_results['files_objs_names'][ filepath.replace("\\", "/") ] = objects_names
+    job_results['objs_names'].extend(objects_names)
 
-        elapsed_time = time.time() - start_time
-        if objects_names:
-            print(f"OBJS: {objects_names}")
-            print(f"TIME: {elapsed_time:.3f} s.")
-            print()
+    if operator.job_results_rich:
+        if 'resources' in filepath:
+            job_results['files_objs_names'][ filepath.replace("\\", "/").partition("resources/")[2] ] = objects_names
         else:
-            print("FAILED!!!")
-            print()
+            job_results['files_objs_names'][ filepath.replace("\\", "/") ] = objects_names
 
-        
-        return True
+    elapsed_time = time.time() - start_time
+    if objects_names:
+        print(f"OBJS: {objects_names}")
+        print(f"TIME: {elapsed_time:.3f} s.")
+        print()
     else:
-        return False
\ No newline at end of file
+        print("FAILED!!!")
+        print()
+
+    
+    return True
\ No newline at end of file
@@ -0,0 +1,271 @@
+# <pep8 compliant>
+
+"""
+This script imports all the Star Wars: The Old Republic models in a folder
+(and its subfolders) into Blender.
+
+Usage:
+Run this script from "File->Import" menu and then choose the desired folder.
+Files are imported one by one between UI updates, with a progress report,
+and the import can be cancelled by pressing ESC.
+
+About the Add-on's structure and entry points:
+
+class ImportGR2Directory
+    invoke()       <- Called by File->Import menu option
+    Execute()      <- Called by other Add-ons and scripts (imports without
+                      returning control to the UI if not invoked).
+        modal()    <- Imports a file per timer event.
+            import_gr2.load()
+"""
+
+import glob
+import json
+import os
+from fnmatch import fnmatch
+from typing import List, Set
+
+import bpy
+from bpy import app
+from bpy.props import BoolProperty, EnumProperty, StringProperty
+from bpy.types import Context, Event, Operator
+from bpy_extras.wm_utils.progress_report import ProgressReport
+
+from .import_gr2 import load as ImportGR2_load  # .gr2 importing function used by this module
+from .import_gr2 import ImportGR2Options, import_options, parse_cache
+
+from ..utils.batch import prefetch_files
+
+from ..types.shared import job_results  # add-on-wide global-like dict
+
+
+def find_files(directory, include_filter, exclude_filter, sort_order):
+    # type: (str, str, str, str) -> List[str]
+    """
+    Returns the paths of the .gr2 files in directory matching any of the
+    semicolon-separated glob patterns of include_filter ('**' matches any
+    number of subfolders) and none of those of exclude_filter, largest first
+    or by name.
+    """
+    paths = set()
+    for pattern in filter(None, (pattern.strip() for pattern in include_filter.split(";"))):
+        for path in glob.glob(os.path.join(glob.escape(directory), pattern), recursive=True):
+            if path.lower().endswith(".gr2") and os.path.isfile(path):
+                paths.add(os.path.normpath(path))
+
+    excluded = [pattern.strip() for pattern in exclude_filter.split(";") if pattern.strip()]
+    if excluded:
+        paths = {path for path in paths
+                 if not any(fnmatch(os.path.relpath(path, directory).replace("\\", "/"), pattern)
+                            for pattern in excluded)}
+
+    if sort_order == 'LARGEST':
+        return sorted(paths, key=lambda path: (-os.path.getsize(path), path))
+    return sorted(paths)
+
+
+class ImportGR2Directory(Operator, ImportGR2Options):
+    """
+    Import all the SWTOR GR2 files (.gr2) in a folder
+
+    Produces a file browser for choosing a folder
+    whose .gr2 object files, including those in
+    its subfolders, are imported one by one.
+    """
+    bl_idname = "import_mesh.gr2_directory"  # DO NOT CHANGE
+    bl_description = "Import all the SWTOR game objects and skeletons in a folder\nand its subfolders, optionally filtered by filename patterns.\n\n• Shows the import's progress and can be cancelled\n   between files by pressing ESC.\n\n• Uses the .gr2 importer's settings"
+    bl_label = "Import SWTOR Folder (.gr2)"
+    bl_options = {'UNDO'}
+
+
+
+    # File Browser properties
+
+    if app.version < (2, 82, 0):
+        directory = StringProperty(subtype='DIR_PATH')
+    else:
+        directory: StringProperty(subtype='DIR_PATH')
+
+    filter_folder: BoolProperty(
+        default=True,
+        options={'HIDDEN'},
+    )
+
+    filter_glob: StringProperty(
+        default="*.gr2",
+        options={'HIDDEN'},
+    )
+
+
+
+    # Files selection properties
+
+    include_filter: StringProperty(
+        name="Include",
+        description="Glob patterns of the files to import, relative to the chosen folder\nand separated by semicolons. '**' matches any number of subfolders.\n\nExamples:\n- **/*.gr2  imports all the .gr2 files in the folder and its subfolders.\n- *.gr2  imports only those directly in the folder.\n- **/head/**/*.gr2;**/hair/**/*.gr2  imports those in head and hair subfolders",
+        default="**/*.gr2",
+    )
+
+    exclude_filter: StringProperty(
+        name="Exclude",
+        description="Patterns of the files to leave out, matched against their paths relative\nto the chosen folder and separated by semicolons.\n\nExample:\n- *_collision*;*/skeleton/*",
+        default="",
+    )
+
+    sort_order: EnumProperty(
+        name="Order",
+        description="Order in which the files are imported",
+        items=[('NAME',    "By Name",       "Import the files in alphabetical order of their paths"),
+               ('LARGEST', "Largest First", "Import the largest files first, so that the slowest\npart of the import is done early on"),
+               ],
+        default='NAME',
+    )
+
+
+
+    # Modal import state
+    _timer = None
+    _progress = None
+    _paths = None
+    _parsed_files = None
+    _done = 0
+    _failed = None
+
+
+
+    def invoke(self, context, event):
+        # type: (Context, Event) -> Set[str]
+        self.options_from_prefs(context)
+
+        # Handling of directory in case of being
+        # filled as a param in an external call.
+        if not self.directory:
+            context.window_manager.fileselect_add(self)
+            return {'RUNNING_MODAL'}
+        else:
+            return self.execute(context)
+
+
+    def execute(self, context):
+        # type: (Context) -> Set[str]
+
+        # Results always include the files' objects,
+        # as they are filled in file by file
+        self.job_results_rich = True
+
+        if not self.job_results_accumulate:
+            job_results['objs_names'] = []
+            job_results['files_objs_names'] = {}
+
+        job_results['job_origin'] = self.bl_idname
+
+        if not 'files_objs_names' in job_results:
+            job_results['files_objs_names'] = {}
+
+        if not os.path.isdir(self.directory):
+            self.report({'ERROR'}, f"{self.directory} is not a folder")
+            return {'CANCELLED'}
+
+        self._paths = find_files(self.directory, self.include_filter, self.exclude_filter, self.sort_order)
+        if not self._paths:
+            self.report({'WARNING'}, f"No .gr2 files matching the filters in {self.directory}")
+            return {'CANCELLED'}
+
+        print()
+        print(f"FOLDER: {self.directory} ({len(self._paths)} .gr2 files)")
+        print()
+
+        # The next files are parsed in the background
+        # while the current one is being built
+        self._parsed_files = prefetch_files(self._paths, cache=parse_cache(),
+                                            import_collision=import_options(self)["import_collision"])
+        self._done = 0
+        self._failed = []
+
+        wm = context.window_manager
+        self._progress = ProgressReport(wm if context.window else None)
+        self._progress.start()
+        self._progress.enter_substeps(len(self._paths), f"Importing {len(self._paths)} .gr2 files")
+
+        if not self.options.is_invoke or not context.window:
+            # Called by scripts: import everything right away
+            while self.import_next(context):
+                pass
+            return self.finish(context)
+
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+
+    def modal(self, context, event):
+        # type: (Context, Event) -> Set[str]
+
+        if event.type == 'ESC':
+            return self.finish(context, cancelled=True)
+
+        if event.type == 'TIMER':
+            try:
+                if not self.import_next(context):
+                    return self.finish(context)
+            except Exception:
+                self.finish(context, cancelled=True)
+                raise
+            context.workspace.status_text_set(
+                f"Importing .gr2 files: {self._done} / {len(self._paths)}  (ESC to cancel)")
+
+        return {'PASS_THROUGH'}
+
+
+    def import_next(self, context):
+        # type: (Context) -> bool
+        """
+        Imports the next file, streaming its results into job_results and the
+        scene's io_scene_gr2_last_job. Returns False once all are imported.
+        """
+        try:
+            path, gr2 = next(self._parsed_files)
+        except StopIteration:
+            return False
+
+        if isinstance(gr2, ValueError):
+            self.report({'WARNING'}, str(gr2))
+            self._failed.append(path)
+        elif not ImportGR2_load(self, context, path, gr2=gr2):
+            self._failed.append(path)
+
+        self._done += 1
+        self._progress.step(os.path.relpath(path, self.directory))
+        context.scene.io_scene_gr2_last_job = json.dumps(job_results)
+        return True
+
+
+    def finish(self, context, cancelled=False):
+        # type: (Context, bool) -> Set[str]
+        """
+        Ends the import, keeping whatever was imported (even when cancelled, so
+        that it can be undone as a whole).
+        """
+        wm = context.window_manager
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+            context.workspace.status_text_set(None)
+
+        # Stops the background parsing
+        self._parsed_files.close()
+
+        imported = self._done - len(self._failed)
+        self._progress.leave_substeps(f"{imported} .gr2 files imported")
+        self._progress.finalize()
+
+        context.scene.io_scene_gr2_last_job = json.dumps(job_results)
+
+        if cancelled:
+            self.report({'WARNING'}, f"Import cancelled: {imported} of {len(self._paths)} .gr2 files imported")
+        elif self._failed:
+            self.report({'WARNING'}, f"{len(self._failed)} of {len(self._paths)} .gr2 files couldn't be imported (see the console)")
+        else:
+            self.report({'INFO'}, f"{imported} .gr2 files imported")
+
+        return {'FINISHED'}
@@ -11,7 +11,7 @@ https://github.com/SWTOR-Slicers/WikiPedia/wiki/JBA-File-Structure
 
 import math
 import os
-from typing import Optional, Set
+from typing import List, Optional, Set
 
 from bpy import app
 from bpy.props import BoolProperty, CollectionProperty, FloatProperty, StringProperty
@@ -20,7 +20,7 @@ from bpy_extras.io_utils import ImportHelper
 from mathutils import Matrix, Quaternion, Vector
 
 from ..types.jba import JointBoneAnimation
-from ..utils.binary import ArrayBuffer, DataView
+from ..utils.binary import DataView, MappedBuffer
 from ..utils.string import path_split, readCString
 
 
@@ -141,13 +141,11 @@ class ImportJBA(Operator):
         return {'FINISHED'}
 
 
-def _read_rotation_compressed(dv, pos, base, stride):
-    # type: (DataView, int, Vector, Vector) -> Quaternion
-    rot_x_raw = dv.getUint16(pos, True)
+def _decode_rotation_compressed(rot_x_raw, rot_y_raw, rot_z_raw, base, stride):
+    # type: (int, int, int, Vector, Vector) -> Quaternion
     rot_x = base.x + (rot_x_raw & 32767) * stride.x
-    rot_y = base.y + dv.getUint16(pos + 2, True) * stride.y
-    rot_z = base.z + dv.getUint16(pos + 4, True) * stride.z
-    pos += 6
+    rot_y = base.y + rot_y_raw * stride.y
+    rot_z = base.z + rot_z_raw * stride.z
     rot_dot = rot_x * rot_x + rot_y * rot_y + rot_z * rot_z
     rot_w = 0.0 if rot_dot > 1.0 else math.sqrt(1.0 - rot_dot)
 
@@ -157,11 +155,8 @@ def _read_rotation_compressed(dv, pos, base, stride):
     return Quaternion((rot_w, rot_x, rot_y, rot_z)).normalized()
 
 
-def _read_translation_compressed(dv, pos, base, stride):
-    # type: (DataView, int, Vector, Vector) -> Vector
-    val = dv.getUint32(pos, True)
-    pos += 4
-
+def _decode_translation_compressed(val, base, stride):
+    # type: (int, Vector, Vector) -> Vector
     pos_x = base.x + (val >> 21) * stride.x
     pos_y = base.y + ((val >> 10) & 2047) * stride.y
     pos_z = base.z + (val & 1023) * stride.z
@@ -169,13 +164,21 @@ def _read_translation_compressed(dv, pos, base, stride):
     return Vector((pos_x, pos_y, pos_z))
 
 
+def _read_rotations_compressed(dv, pos, count, stride, base, base_stride):
+    # type: (DataView, int, int, int, Vector, Vector) -> List[Quaternion]
+    raw = dv.getStridedArray(pos, count, stride, 'H', 3, True)
+    return [_decode_rotation_compressed(raw[i * 3], raw[i * 3 + 1], raw[i * 3 + 2], base, base_stride)
+            for i in range(count)]
+
+
+def _read_translations_compressed(dv, pos, count, base, stride):
+    # type: (DataView, int, int, Vector, Vector) -> List[Vector]
+    return [_decode_translation_compressed(val, base, stride) for val in dv.getUint32Array(pos, count, True)]
+
+
 def read(operator, filepath):
     # type: (Operator, str) -> Optional[JointBoneAnimation]
-    with open(filepath, 'rb') as file:
-        buffer = ArrayBuffer()
-        buffer.fromfile(file, os.path.getsize(filepath))
-
-    dv = DataView(buffer)
+    dv = DataView(MappedBuffer(filepath))
     pos = 0
 
     # Cancel import if this is not a BioWare Austin / SWTOR JBA file
@@ -199,11 +202,11 @@ def read(operator, filepath):
     # NOTE: Block headers
     num_frames = round(length * fps) + 1
     blocks = [None] * num_blocks
+    block_headers = dv.getUint32Array(pos, num_blocks * 2, True)
+    pos += num_blocks * 8
     for i in range(num_blocks):
-        start_frame = dv.getUint32(pos, True)
-        pos += 4
-        block_size = dv.getUint32(pos, True)
-        pos += 4
+        start_frame = block_headers[i * 2]
+        block_size = block_headers[i * 2 + 1]
         blocks[i] = JointBoneAnimation.Block(start_frame, block_size)
         if i > 0:
             blocks[i - 1].num_frames = 1 + blocks[i].start_frame - blocks[i - 1].start_frame
@@ -215,14 +218,12 @@ def read(operator, filepath):
     pos = (pos + 127) & -128
     bones = [None] * num_bones
     for i in range(num_bones):
-        translation_stride = Vector([dv.getFloat32(pos + (j * 4), True) for j in range(3)])
-        pos += 12
-        translation_base = Vector([dv.getFloat32(pos + (j * 4), True) for j in range(3)])
-        pos += 12
-        rotation_stride = Vector([dv.getFloat32(pos + (j * 4), True) for j in range(3)])
-        pos += 12
-        rotation_base = Vector([dv.getFloat32(pos + (j * 4), True) for j in range(3)])
-        pos += 12
+        values = dv.getFloat32Array(pos, 12, True)
+        translation_stride = Vector(values[0:3])
+        translation_base = Vector(values[3:6])
+        rotation_stride = Vector(values[6:9])
+        rotation_base = Vector(values[9:12])
+        pos += 48
         bone = JointBoneAnimation.Bone(rotation_base, rotation_stride, translation_base, translation_stride)
         bone.rotations = [None] * num_frames
         bone.translations = [None] * num_frames
@@ -239,34 +240,26 @@ def read(operator, filepath):
         assert(num_block_bones == num_bones)
         pos += 4  # unknown
 
-        # Keyframe layout
-        has_translations = [None] * num_block_bones
-        for j in range(num_block_bones):
-            # num_rotations = dv.getUint32(pos, True)
-            pos += 4
-            pos += 4  # unknown
-            num_translations = dv.getUint32(pos, True)
-            pos += 4
-            pos += 4  # unknown
-            has_translations[j] = num_translations > 0
+        # Keyframe layout: num_rotations, unknown, num_translations, unknown (4 x uint32 per bone)
+        has_translations = [num_translations > 0 for num_translations in
+                            dv.getStridedArray(pos + 8, num_block_bones, 16, 'I', 1, True)]
+        pos += num_block_bones * 16
 
         # Keyframes
         for j in range(num_bones):
             bone = bones[j]
 
             # Rotations
-            for k in range(block.num_frames):
-                bone.rotations[block.start_frame + k] = _read_rotation_compressed(
-                    dv, pos, bone.rotation_base, bone.rotation_stride)
-                pos += 6
+            bone.rotations[block.start_frame:block.start_frame + block.num_frames] = _read_rotations_compressed(
+                dv, pos, block.num_frames, 6, bone.rotation_base, bone.rotation_stride)
+            pos += block.num_frames * 6
 
             # Translations
             pos = (pos + 3) & -4
             if has_translations[j]:
-                for k in range(block.num_frames):
-                    bone.translations[block.start_frame + k] = _read_translation_compressed(
-                        dv, pos, bone.translation_base, bone.translation_stride)
-                    pos += 4
+                bone.translations[block.start_frame:block.start_frame + block.num_frames] = _read_translations_compressed(
+                    dv, pos, block.num_frames, bone.translation_base, bone.translation_stride)
+                pos += block.num_frames * 4
             else:
                 for k in range(block.num_frames):
                     pos_x = bone.translation_base.x + 2047 * bone.translation_stride.x
@@ -280,14 +273,12 @@ def read(operator, filepath):
     pos += 4  # unknown
     # fps = dv.getFloat32(pos, True)
     pos += 4
-    translation_stride = Vector([dv.getFloat32(pos + (i * 4), True) for i in range(3)])
-    pos += 12
-    translation_base = Vector([dv.getFloat32(pos + (i * 4), True) for i in range(3)])
-    pos += 12
-    rotation_stride = Vector([dv.getFloat32(pos + (i * 4), True) for i in range(3)])
-    pos += 12
-    rotation_base = Vector([dv.getFloat32(pos + (i * 4), True) for i in range(3)])
-    pos += 12
+    values = dv.getFloat32Array(pos, 12, True)
+    translation_stride = Vector(values[0:3])
+    translation_base = Vector(values[3:6])
+    rotation_stride = Vector(values[6:9])
+    rotation_base = Vector(values[9:12])
+    pos += 48
     num_rotations = dv.getUint32(pos, True)
     pos += 4
     assert(num_rotations == num_frames)
@@ -297,14 +288,12 @@ def read(operator, filepath):
     # assert(num_translations == num_faces)
     pos += 4  # unknown
 
-    rotations = [_read_rotation_compressed(dv, pos + (i * 8), rotation_base, rotation_stride)
-                 for i in range(num_frames)]
+    rotations = _read_rotations_compressed(dv, pos, num_frames, 8, rotation_base, rotation_stride)
     pos += num_frames * 6
 
     pos = (pos + 3) & -4
 
-    translations = [_read_translation_compressed(dv, pos + (i * 4), translation_base, translation_stride)
-                    for i in range(num_frames)]
+    translations = _read_translations_compressed(dv, pos, num_frames, translation_base, translation_stride)
     pos += num_frames * 4
 
     world_space = JointBoneAnimation.WorldSpace(rotations, translations)
@@ -321,7 +310,7 @@ def read(operator, filepath):
     off_names = dv.getUint32(pos, True)
     pos += 4
     pos += num_names * 4  # numbers from 0 to num_names - 1
-    name_offsets = [dv.getUint32(pos + (i * 4), True) for i in range(num_names)]
+    name_offsets = dv.getUint32Array(pos, num_names, True)
     pos += num_names * 4
     bone_names = [readCString(dv, names_start + off_names + name_offsets[i]) for i in range(num_names)]
 
@@ -1,11 +1,11 @@
 # <pep8 compliant>
 
-from typing import Dict, Iterator, List, Sequence, Tuple, Union
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
-from mathutils import Color, Vector
-
-from ..utils.binary import DataView
-from ..utils.string import readString
+from ..utils.binary import DataView, MappedBuffer, UncheckedDataView
+from ..utils.string import StringTable
+from ..utils.vertex import check_triangles, decode_vertex_buffer, vertex_layout_size
 
 
 class Granny2:
@@ -14,7 +14,7 @@ class Granny2:
 
     __slots__ = ("offset_BNRY", "type_flag", "bounds", "offset_cached_offsets",
                  "offset_mesh_headers", "offset_material_name_offsets", "mesh_buffer",
-                 "bone_buffer", "material_names", "num_bytes", "version")
+                 "bone_buffer", "bone_matrices", "material_names", "num_bytes", "version")
 
     class Bone:
         """
@@ -50,17 +50,19 @@ class Granny2:
                     if num >= 3 and isinstance(kwargs.get("version", args[2]), int):
                         version = kwargs.get("version", args[2])
 
+                    # Optional per-file string table, shared between bone tables
+                    strings: StringTable = kwargs.get("strings") or StringTable(dv)
 
                     if version == 4:
-                        self.name = readString(dv, pos)
+                        self.name = strings.readString(pos)
                         pos += 4
                     else:
                         # if version 5
-                        self.name = readString(dv, pos,posOverride= dv.getUint64(pos, True))
+                        self.name = strings.readString(pos, posOverride=dv.getUint64(pos, True))
                         pos += 8
                     
                     if num >= 4 and kwargs.get("bounds", args[3]) is True:
-                        self.bounds = tuple(dv.getFloat32(pos + (i * 4), 1) for i in range(6))
+                        self.bounds = tuple(dv.getFloat32Array(pos, 6, 1))
                         pos += 24
                         return
 
@@ -72,9 +74,10 @@ class Granny2:
                         # something is here? we don't know what it is
                         pos += 4
 
-                    # self.bone_to_parent = [dv.getFloat32(pos + (i * 4), 1) for i in range(16)]
+                    # self.bone_to_parent = dv.getFloat32Array(pos, 16, 1).tolist()
                     pos += 64
-                    self.root_to_bone = [dv.getFloat32(pos + (i * 4), 1) for i in range(16)]
+                    # root_to_bone is set by Granny2.read(), which reads the
+                    # matrices of all the bones at once (see bone_matrices)
                     pos += 64
 
     class BoundingBox:
@@ -135,14 +138,16 @@ class Granny2:
         """
         """
 
-        __slots__ = ("_mesh_name", "bone_buffer", "indices_buffer", "offset_bones_buffer",
-                     "offset_indices_buffer", "offset_mesh_name", "offset_piece_headers",
-                     "offset_vertex_buffer", "piece_header_buffer", "vertex_buffer")
+        __slots__ = ("_indices_buffer", "_mesh_name", "_source", "_vertex_buffer", "bone_buffer",
+                     "offset_bones_buffer", "offset_indices_buffer", "offset_mesh_name",
+                     "offset_piece_headers", "offset_vertex_buffer", "piece_header_buffer")
 
         bone_buffer:         Dict[int, "Granny2.Bone"]
-        indices_buffer:      Dict[int, Tuple[int]]
         piece_header_buffer: Dict[int, "Granny2.Piece"]
-        vertex_buffer:       Dict[int, "Granny2.Vertex"]
+
+        # (dv, bit_flag2, vertex_size, num_vertices, num_indices) of the file section
+        # the vertex and indices buffers are decoded from on first access.
+        _source: Optional[Tuple[DataView, int, int, int, int]]
 
         offset_mesh_name: int       # 0x70 Uint32
 
@@ -154,11 +159,70 @@ class Granny2:
         def __init__(self, name):
             # type: (str) -> None
             self._mesh_name = name
+            self._indices_buffer = None
+            self._source = None
+            self._vertex_buffer = None
 
         def __str__(self):
             # type: () -> str
             return self.name
 
+        def set_source(self, dv, bit_flag2, vertex_size, num_vertices, num_indices):
+            # type: (DataView, int, int, int, int) -> None
+            """
+            Backs the mesh with a file section instead of decoded buffers. The vertex
+            and indices buffers are only decoded from it when first accessed, at
+            offset_vertex_buffer and offset_indices_buffer.
+            """
+            self._source = (dv, bit_flag2, vertex_size, num_vertices, num_indices)
+
+        @property
+        def vertex_buffer(self):
+            # type: () -> Optional[Granny2.VertexBuffer]
+            if self._vertex_buffer is None and self._source is not None:
+                dv, bit_flag2, vertex_size, num_vertices, _ = self._source
+                self._vertex_buffer = Granny2.VertexBuffer.from_columns(decode_vertex_buffer(
+                    dv, self.offset_vertex_buffer, num_vertices, bit_flag2, vertex_size))
+            return self._vertex_buffer
+
+        @vertex_buffer.setter
+        def vertex_buffer(self, value):
+            # type: (Granny2.VertexBuffer) -> None
+            self._vertex_buffer = value
+
+        @property
+        def indices_buffer(self):
+            # type: () -> Optional[array]
+            if self._indices_buffer is None and self._source is not None:
+                dv, _, _, _, num_indices = self._source
+                self._indices_buffer = dv.getUint16Array(self.offset_indices_buffer, num_indices, True)
+            return self._indices_buffer
+
+        @indices_buffer.setter
+        def indices_buffer(self, value):
+            # type: (array) -> None
+            self._indices_buffer = value
+
+        def detach(self):
+            # type: () -> None
+            """
+            Decodes the vertex and indices buffers now and drops the file section
+            backing them, so that the mesh can outlive (or be pickled without) the
+            file mapping it was read from.
+            """
+            self._vertex_buffer = self.vertex_buffer
+            self._indices_buffer = self.indices_buffer
+            self._source = None
+
+        def check_indices(self):
+            # type: () -> Dict[str, int]
+            """
+            Counts the out of range, degenerate and duplicate triangles of the
+            indices buffer (see utils.vertex.check_triangles). All zeros means the
+            mesh can be built without a Mesh.validate() pass.
+            """
+            return check_triangles(self.indices_buffer or [], self.num_vertices)
+
         @property
         def name(self):
             # type: () -> str
@@ -191,24 +255,12 @@ class Granny2:
         @property
         def bit_flag2(self):           # 0x7C Uint16
             # type: () -> int
-            flag = 0
-            if getattr(self, "vertex_buffer", None):
-                vertex = self.vertex_buffer[0]
-                if getattr(vertex, "position", None):
-                    flag |= 1
-                if getattr(vertex, "normals", None) and getattr(vertex, "tangents", None):
-                    flag |= 2 | 4 | 8
-                if getattr(vertex, "color", None):
-                    flag |= 16
-                if getattr(vertex, "uv_layer0", None):
-                    flag |= 32
-                if getattr(vertex, "uv_layer1", None):
-                    flag |= 64
-                if getattr(vertex, "uv_layer2", None):
-                    flag |= 128
-                if getattr(vertex, "bone_indices", None) and getattr(vertex, "bone_weights", None):
-                    flag |= 256
-            return flag
+            if self._vertex_buffer is None and self._source is not None:
+                return self._source[1]
+            elif self._vertex_buffer:
+                return self._vertex_buffer.bit_flag2
+            else:
+                return 0
 
         @property
         def vertex_size(self):         # 0x7E Uint16
@@ -234,41 +286,88 @@ class Granny2:
         @property
         def num_vertices(self):        # 0x80 Uint32
             # type: () -> int
-            if getattr(self, "vertex_buffer", None):
-                return len(self.vertex_buffer)
+            if self._vertex_buffer is None and self._source is not None:
+                return self._source[3]
+            elif self._vertex_buffer:
+                return len(self._vertex_buffer)
             else:
                 return 0
 
         @property
         def num_polygons(self):        # 0x84 Uint32
             # type: () -> int
-            if getattr(self, "indices_buffer", None):
-                return len(self.indices_buffer)
+            if self._indices_buffer is None and self._source is not None:
+                return self._source[4] // 3
+            elif self._indices_buffer:
+                return len(self._indices_buffer) // 3
             else:
                 return 0
 
-    class Vertex:
+    class VertexBuffer:
         """
+        Structure-of-arrays vertex storage, one flat column per attribute. Values
+        are kept in the same encoding as in the file: normals, tangents, colors
+        and bone weights are unsigned bytes, and UVs are not flipped.
         """
 
-        __slots__ = ("position", "bone_weights", "bone_indices", "color", "normals", "tangents",
-                     "uv_layer0", "uv_layer1", "uv_layer2")
-
-        position:     Vector  # vec3
-        bone_weights: Vector  # vec4
-        bone_indices: Vector  # vec4
-        color:        Color   # rgb
-        normals:      Vector  # vec4
-        tangents:     Vector  # vec4
-        uv_layer0:    Vector  # vec2
-        uv_layer1:    Vector  # vec2
-        uv_layer2:    Vector  # vec2
+        __slots__ = ("bone_indices", "bone_weights", "color", "normals", "positions", "tangents", "uv_layers")
+
+        positions:    array            # float32 x 3
+        bone_weights: Optional[array]  # uint8 x 4
+        bone_indices: Optional[array]  # uint8 x 4
+        normals:      Optional[array]  # uint8 x 4
+        tangents:     Optional[array]  # uint8 x 4
+        color:        Optional[array]  # uint8 x 4
+        uv_layers:    List[array]      # float32 x 2 per layer
+
+        def __init__(self, positions=None, bone_weights=None, bone_indices=None, normals=None, tangents=None,
+                     color=None, uv_layers=None):
+            # type: (Optional[array], Optional[array], Optional[array], Optional[array], Optional[array], Optional[array], Optional[List[array]]) -> None
+            self.positions = positions if positions is not None else array('f')
+            self.bone_weights = bone_weights
+            self.bone_indices = bone_indices
+            self.normals = normals
+            self.tangents = tangents
+            self.color = color
+            self.uv_layers = uv_layers if uv_layers is not None else []
+
+        def __len__(self):
+            # type: () -> int
+            return len(self.positions) // 3
+
+        @classmethod
+        def from_columns(cls, columns):
+            # type: (Dict[str, array]) -> Granny2.VertexBuffer
+            return cls(columns["position"], columns.get("bone_weights"), columns.get("bone_indices"),
+                       columns.get("normals"), columns.get("tangents"), columns.get("color"),
+                       [columns[name] for name in ("uv_layer0", "uv_layer1", "uv_layer2") if name in columns])
+
+        def to_columns(self):
+            # type: () -> Dict[str, array]
+            columns = {"position": self.positions}
+            for name in ("bone_weights", "bone_indices", "normals", "tangents", "color"):
+                if getattr(self, name) is not None:
+                    columns[name] = getattr(self, name)
+            for i, uv_layer in enumerate(self.uv_layers):
+                columns[f"uv_layer{i}"] = uv_layer
+            return columns
 
-        def __init__(self, seq=(0.0, 0.0, 0.0)):
-            # type: (Sequence[Union[float, int]]) -> None
-            self.position = Vector(seq)
+        @property
+        def bit_flag2(self):
+            # type: () -> int
+            flag = 1 if len(self.positions) else 0
+            if self.normals is not None and self.tangents is not None:
+                flag |= 2 | 4 | 8
+            if self.color is not None:
+                flag |= 16
+            for i in range(min(len(self.uv_layers), 3)):
+                flag |= 32 << i
+            if self.bone_indices is not None and self.bone_weights is not None:
+                flag |= 256
+            return flag
 
     bone_buffer:    Dict[int, "Granny2.Bone"]
+    bone_matrices:  array              # root_to_bone of every bone, 16 Float32 each
     material_names: Dict[int, str]
     mesh_buffer:    Dict[int, "Granny2.Mesh"]
 
@@ -346,6 +445,415 @@ class Granny2:
         # type: () -> int
         return 0
 
+    @staticmethod
+    def validate(dv, strings=None):
+        # type: (DataView, Optional[StringTable]) -> None
+        """
+        Checks the structure of a GR2 file once, before it is read: the magic bytes and
+        version, and every section offset and length referenced by the file header and
+        the mesh headers against the size of the buffer. Handles both the v4 (32-bit)
+        and v5 (64-bit) layouts.
+
+        :param dv: View of the whole file.
+        :type dv: `DataView`
+        :param strings: String table to decode the checked names into, so that they are
+        not decoded again by the reader.
+        :type strings: Optional[`StringTable`]
+
+        :raises ValueError: If the file is not a GR2 file, or a section lies outside it.
+        """
+        size = dv.byteLength
+        strings = strings or StringTable(dv)
+
+        if size < 8 or dv.getUint32(0, True) != 0x42574147:
+            raise ValueError("bad magic bytes")
+
+        version = dv.getUint32(4, True)
+        if version not in (4, 5):
+            raise ValueError(f"unsupported version {version}")
+
+        is64 = version == 5
+        if size < (0x70 if is64 else 0x60):
+            raise ValueError("truncated file header")
+
+        def check(offset, length, section):
+            # type: (int, int, str) -> None
+            if offset + length > size:
+                raise ValueError(f"{section} at {offset:#x} (+{length} bytes) lies outside the file ({size} bytes)")
+
+        def check_name(pos, section):
+            # type: (int, str) -> None
+            offset = dv.getUint64(pos, True) if is64 else dv.getUint32(pos, True)
+            try:
+                strings.readCString(offset)
+            except IndexError:
+                raise ValueError(f"{section} name at {offset:#x} is not terminated inside the file ({size} bytes)") from None
+
+        num_meshes, num_materials, num_bones = dv.getUint16Array(0x18, 3, True)
+
+        if is64:
+            offset_mesh_header, offset_material_name_offsets, offset_bone_struct = (
+                dv.getUint64(0x58 + i * 8, True) for i in range(3))
+            mesh_header_size, pointer_size, mesh_bone_size, bone_size = 64, 8, 32, 144
+        else:
+            offset_mesh_header, offset_material_name_offsets, offset_bone_struct = dv.getUint32Array(
+                0x54, 3, True)
+            mesh_header_size, pointer_size, mesh_bone_size, bone_size = 40, 4, 28, 136
+
+        check(offset_mesh_header, num_meshes * mesh_header_size, "Mesh headers")
+        for i in range(num_meshes):
+            pos = offset_mesh_header + i * mesh_header_size
+            check_name(pos, f"Mesh {i}")
+            pos += pointer_size + 4  # Name, BitFlag1
+            num_pieces, num_used_bones = dv.getUint16Array(pos, 2, True)
+            pos += 4
+            if is64:
+                bit_flag2, vertex_size = dv.getUint32Array(pos, 2, True)
+                pos += 8
+                num_vertices, num_indices = dv.getUint32Array(pos, 2, True)
+                pos += 8
+                offsets = [dv.getUint64(pos + j * 8, True) for j in range(4)]
+            else:
+                bit_flag2, vertex_size = dv.getUint16Array(pos, 2, True)
+                pos += 4
+                num_vertices, num_indices = dv.getUint32Array(pos, 2, True)
+                pos += 8
+                offsets = dv.getUint32Array(pos, 4, True)
+
+            offset_vertex_buffer, offset_piece_headers, offset_indices_buffer, offset_bones_buffer = offsets
+            layout_size = vertex_layout_size(bit_flag2)
+
+            # Meshes without vertices are valid (and decode to empty columns),
+            # whatever their vertex size.
+            if num_vertices and vertex_size < layout_size:
+                raise ValueError(f"Mesh {i} vertex size {vertex_size} is smaller than its attributes ({layout_size})")
+
+            check(offset_piece_headers, num_pieces * 48, f"Mesh {i} piece headers")
+            if num_vertices:
+                check(offset_vertex_buffer, (num_vertices - 1) * vertex_size + layout_size, f"Mesh {i} vertex buffer")
+            check(offset_indices_buffer, (num_indices // 3) * 6, f"Mesh {i} indices buffer")
+            check(offset_bones_buffer, num_used_bones * mesh_bone_size, f"Mesh {i} bones buffer")
+            for j in range(num_used_bones):
+                check_name(offset_bones_buffer + j * mesh_bone_size, f"Mesh {i} bone {j}")
+
+        check(offset_material_name_offsets, num_materials * pointer_size, "Material name offsets")
+        for i in range(num_materials):
+            check_name(offset_material_name_offsets + i * pointer_size, f"Material {i}")
+
+        check(offset_bone_struct, num_bones * bone_size, "Skeleton bones")
+        for i in range(num_bones):
+            check_name(offset_bone_struct + i * bone_size, f"Bone {i}")
+
+    @staticmethod
+    def read(filepath):
+        # type: (str) -> Granny2
+        """
+        Reads a whole GR2 file. Handles both the v4 (32-bit) and v5 (64-bit) layouts.
+        Mesh vertex and indices buffers are decoded on first access (see Mesh.detach()).
+
+        :param filepath: The path of the GR2 file to read.
+        :type filepath: `str`
+
+        :return: The file's header, meshes, material names and skeleton bones.
+        :rtype: `Granny2`
+
+        :raises ValueError: If this is not a valid SWTOR GR2 file, or if any of its
+        sections lies outside of it.
+        """
+        dv = DataView(MappedBuffer(filepath))
+        strings = StringTable(dv)
+        pos = 0
+
+        try:
+            Granny2.validate(dv, strings)
+        except ValueError as error:
+            raise ValueError(f"{filepath} is not a valid SWTOR gr2 file: {error}.") from None
+
+        # The layout has been checked, so skip the per-read checks from here on.
+        dv = UncheckedDataView(dv.buffer)
+
+        gr2 = Granny2()
+
+        pos = 4
+
+        gr2.version = dv.getUint32(pos, 1)                   # GR2 file version
+
+
+        pos = 20  # 0x14, skipping the version numbers, magic numbers and collision offset
+
+        # GR2 file type, 0 = geometry, 1 = geometry with .clo file, 2 = skeleton
+        gr2.type_flag = dv.getUint32(pos, 1)
+        pos += 4
+        num_meshes = dv.getUint16(pos, 1)                    # Number of meshes in this file
+        pos += 2
+        num_materials = dv.getUint16(pos, 1)                 # Number of materials in this file
+        pos += 2
+        num_bones = dv.getUint16(pos, 1)                     # Number of bones in this file
+        pos += 2
+
+        pos += 18
+
+        # Global bounding box, v5 files store it at 0x20 instead
+        gr2.bounds = Granny2.BoundingBox(dv.getFloat32Array(0x20 if gr2.version == 5 else pos, 8, 1))
+        pos += 32
+
+
+
+        offset_mesh_header = None
+        offset_material_name_offsets = None
+        offset_bone_struct = None
+        # 0x50
+        # skipping offset CachedOffset as we don't use it
+        if gr2.version == 5:
+            pos += 8  # 0x54
+            offset_mesh_header = dv.getUint64(pos, 1)            # Mesh header offset address
+            pos += 8
+            offset_material_name_offsets = dv.getUint64(pos, 1)  # Material header offset address
+            pos += 8
+            offset_bone_struct = dv.getUint64(pos, 1)            # Bone structure offset address
+            pos += 8
+        else:	
+            pos += 4  # 0x54
+            offset_mesh_header = dv.getUint32(pos, 1)            # Mesh header offset address
+            pos += 4
+            offset_material_name_offsets = dv.getUint32(pos, 1)  # Material header offset address
+            pos += 4
+            offset_bone_struct = dv.getUint32(pos, 1)            # Bone structure offset address
+            pos += 4
+
+
+        # Meshes
+        gr2.mesh_buffer = {}
+
+        mesh_bin_size = 40
+
+        if gr2.version == 5:
+            mesh_bin_size = 64
+
+        for i in range(num_meshes):
+            pos = offset_mesh_header + (i * mesh_bin_size)
+            # Mesh name
+
+            mesh = None
+
+            if gr2.version == 5:
+                mesh = Granny2.Mesh(strings.readString(pos, posOverride=dv.getUint64(pos, True)))
+                pos += 8
+            else:
+                mesh = Granny2.Mesh(strings.readString(pos))
+                pos += 4
+
+            # operator.report({'INFO'}, f"Read the header for mesh {mesh.name}... {pos}")  # for diagnostics
+
+            # BitFlag1
+            pos += 4
+            # Number of sub meshes that make up this mesh
+            num_pieces = dv.getUint16(pos, 1)
+            pos += 2
+            # Number of bones used by this mesh
+            num_used_bones = dv.getUint16(pos, 1)
+            pos += 2
+            # BitFlag2
+
+            bit_flag2 = None
+            vertex_size = None
+
+            if gr2.version == 5:
+                bit_flag2 = dv.getUint32(pos, 1)
+                pos += 4
+                # 12 = collision, 24 = static, 32+ = dynamic
+                vertex_size = dv.getUint32(pos, 1)
+                pos += 4
+            else:
+                bit_flag2 = dv.getUint16(pos, 1)
+                pos += 2
+                # 12 = collision, 24 = static, 32+ = dynamic
+                vertex_size = dv.getUint16(pos, 1)
+                pos += 2
+
+            # Total number of vertices used by this mesh
+            num_vertices = dv.getUint32(pos, 1)
+            pos += 4
+            # Total number of polygons used by this mesh
+            num_polygons = dv.getUint32(pos, 1)
+            pos += 4
+
+            if gr2.version == 5:
+                # Offset of the vertices buffer for this mesh
+                mesh.offset_vertex_buffer = dv.getUint64(pos, 1)
+                pos += 8
+                 # Offset of the sub mesh header(s)
+                mesh.offset_piece_headers = dv.getUint64(pos, 1)
+                pos += 8
+                # Offset of the indices buffer for this mesh
+                mesh.offset_indices_buffer = dv.getUint64(pos, 1)
+                pos += 8
+                # Offset of the bones buffer for this mesh
+                mesh.offset_bones_buffer = dv.getUint64(pos, 1)
+                pos += 8
+            else:
+                mesh.offset_vertex_buffer = dv.getUint32(pos, 1)
+                pos += 4
+                mesh.offset_piece_headers = dv.getUint32(pos, 1)
+                pos += 4
+                mesh.offset_indices_buffer = dv.getUint32(pos, 1)
+                pos += 4
+                mesh.offset_bones_buffer = dv.getUint32(pos, 1)
+                pos += 4
+
+            # Sub mesh header(s)
+            mesh.piece_header_buffer = {}
+            for j in range(num_pieces):
+                pos = mesh.offset_piece_headers + (j * 48)
+
+                piece = Granny2.Piece()
+
+                (piece.offset_indices,   # Relative offset for this piece's faces
+                 piece.num_polygons,     # Number of faces used by this piece
+                 piece.material_index,   # Mesh piece material id
+                 piece.index,            # Mesh piece enumerator (1 x uint32)
+                 ) = dv.getUint32Array(pos, 4, 1)
+                pos += 16
+                # piece.bounds = Granny2.BoundingBox(           # Bounding box (8 x 4 bytes)
+                #     dv.getFloat32Array(pos, 8, 1))
+                pos += 32
+
+                mesh.piece_header_buffer[j] = piece
+
+            # Vertex and indices buffers, decoded on first access
+            mesh.set_source(dv, bit_flag2, vertex_size, num_vertices, int(num_polygons / 3) * 3)
+
+            # Bone(s) buffer
+
+            boneSize = 32 if gr2.version == 5 else 28
+
+            mesh.bone_buffer = {j: Granny2.Bone(dv, mesh.offset_bones_buffer + (j * boneSize), gr2.version, True,
+                                                strings=strings)
+                                for j in range(num_used_bones)}
+
+            gr2.mesh_buffer[i] = mesh
+
+        # Materials
+        # NOTE: I wish there was a more efficient way to do this!
+        gr2.material_names = {}
+        if num_materials:
+            pos = offset_material_name_offsets
+            for i in range(num_materials):
+
+                if gr2.version == 5:
+                    gr2.material_names[i] = strings.readString(pos, posOverride=dv.getUint64(pos, 1))
+                    pos += 8
+                else:
+                    gr2.material_names[i] = strings.readString(pos)
+                    pos += 4
+        else:
+            count = 0
+            for mesh in gr2.mesh_buffer.values():
+                if mesh.bit_flag2 & 32:
+                    for j in mesh.piece_header_buffer.keys():  # Use "mesh name".00x for name
+                        gr2.material_names[count] = f"{mesh.name}.{j:03d}"
+                        count += 1
+
+        # Skeleton Bones
+
+        bone_size_of_mem = 144 if gr2.version == 5 else 136
+        offset_root_to_bone = 80 if gr2.version == 5 else 72
+
+        gr2.bone_buffer = {i: Granny2.Bone(dv, offset_bone_struct + (i * bone_size_of_mem), gr2.version, strings=strings)
+                           for i in range(num_bones)}
+
+        # The root_to_bone matrices of all the bones, read in a single pass
+        gr2.bone_matrices = dv.getStridedArray(offset_bone_struct + offset_root_to_bone, num_bones,
+                                               bone_size_of_mem, 'f', 16, True)
+        for i, bone in gr2.bone_buffer.items():
+            bone.root_to_bone = gr2.bone_matrices[i * 16:i * 16 + 16].tolist()
+
+        return gr2
+
+    @staticmethod
+    def scan(filepath):
+        # type: (str) -> Dict[str, Any]
+        """
+        Reads only the fixed header, the mesh headers and the string tables of a GR2
+        file, without touching its vertex, index or bone transform data. Handles both
+        the v4 (32-bit) and v5 (64-bit) layouts.
+
+        :param filepath: The path of the GR2 file to scan.
+        :type filepath: `str`
+
+        :return: Record with the file's version, type_flag, bounds, meshes (name, vertex
+        and polygon counts, bit_flag2, vertex_size, number of pieces and used bones),
+        material names and skeleton bone names.
+        :rtype: Dict[`str`, Any]
+        """
+        dv = DataView(MappedBuffer(filepath))
+
+        strings = StringTable(dv)
+
+        try:
+            Granny2.validate(dv, strings)
+        except ValueError as error:
+            raise ValueError(f"{filepath} is not a valid SWTOR gr2 file: {error}.") from None
+
+        dv = UncheckedDataView(dv.buffer)
+
+        version = dv.getUint32(4, True)
+        is64 = version == 5
+
+        def read_name(pos):
+            # type: (int) -> str
+            if is64:
+                return strings.readString(pos, posOverride=dv.getUint64(pos, True))
+            return strings.readString(pos)
+
+        type_flag = dv.getUint32(0x14, True)
+        num_meshes, num_materials, num_bones = dv.getUint16Array(0x18, 3, True)
+
+        if is64:
+            bounds = dv.getFloat32Array(0x20, 8, True)
+            offset_mesh_header, offset_material_name_offsets, offset_bone_struct = (
+                dv.getUint64(0x58 + i * 8, True) for i in range(3))
+            mesh_header_size, pointer_size, bone_size = 64, 8, 144
+        else:
+            bounds = dv.getFloat32Array(0x30, 8, True)
+            offset_mesh_header, offset_material_name_offsets, offset_bone_struct = dv.getUint32Array(
+                0x54, 3, True)
+            mesh_header_size, pointer_size, bone_size = 40, 4, 136
+
+        meshes = []
+        for i in range(num_meshes):
+            pos = offset_mesh_header + i * mesh_header_size
+            name = read_name(pos)
+            pos += pointer_size + 4  # Name, BitFlag1
+            num_pieces, num_used_bones = dv.getUint16Array(pos, 2, True)
+            pos += 4
+            if is64:
+                bit_flag2, vertex_size = dv.getUint32Array(pos, 2, True)
+                pos += 8
+            else:
+                bit_flag2, vertex_size = dv.getUint16Array(pos, 2, True)
+                pos += 4
+            num_vertices, num_indices = dv.getUint32Array(pos, 2, True)
+
+            meshes.append({
+                "name":           name.replace(' ', '_'),
+                "num_vertices":   num_vertices,
+                "num_polygons":   num_indices // 3,
+                "bit_flag2":      bit_flag2,
+                "vertex_size":    vertex_size,
+                "num_pieces":     num_pieces,
+                "num_used_bones": num_used_bones,
+            })
+
+        return {
+            "version":   version,
+            "type_flag": type_flag,
+            "bounds":    bounds.tolist(),
+            "meshes":    meshes,
+            "materials": [read_name(offset_material_name_offsets + i * pointer_size) for i in range(num_materials)],
+            "bones":     [read_name(offset_bone_struct + i * bone_size) for i in range(num_bones)],
+        }
+
     def calculate_offsets64(self):
 
         count = 0
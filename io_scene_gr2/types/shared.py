@@ -11,6 +11,41 @@ job_results = {'job_origin'        : "",
                'files_objs_names' : {},}
 
 
+# Dict of the mesh data-blocks built by the .gr2 importer,
+# keyed by the imported file's content hash plus the import
+# options that change the resulting geometry, so that repeated
+# imports of the same file (characters sharing gear, area
+# props) can reuse them as linked duplicates instead of
+# parsing and building them again (see import_gr2.py).
+#
+# {<content key>: [{'mesh':        <bpy.data.meshes name>,
+#                   'name':        <mesh's art name>,
+#                   'main':        <True for the file's first mesh>,
+#                   'groups':      [<vertex group names>],
+#                   'bone_bounds': [(<bone name>, <bounds>)]},
+#                  etc.]}
+#
+# Entries are checked against bpy.data before being used,
+# as data-blocks don't survive undo steps or file reloads
+# and can be deleted by the user at any time.
+
+mesh_registry = {}
+
+
+# Dict of the materials created by the .gr2 importer,
+# keyed by their .gr2 material names, so that imports
+# set to reuse materials bind their meshes' slots to
+# them instead of creating .001, .002… duplicates.
+#
+# {<.gr2 material name>: <bpy.data.materials name>}
+#
+# Like mesh_registry entries, they are checked against
+# bpy.data (and the materials' gr2_material_name custom
+# property) before being used.
+
+material_registry = {}
+
+
 # The dict is also converted to .json and placed
 # in a custom scene stringProperty:
 #
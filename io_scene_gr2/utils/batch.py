@@ -0,0 +1,176 @@
+# <pep8 compliant>
+
+"""
+Parallel and pipelined GR2 parsing for multi-file imports and headless
+batch conversions.
+
+Granny2.read() is pure Python and needs no bpy, so several files can be parsed
+at once in worker processes, or ahead of time in a background thread, leaving
+only the bpy-side building to Blender's main thread. Worker processes import
+this package outside of Blender, which is why its __init__.py only registers
+the add-on when bpy is available.
+"""
+
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+from ..types.gr2 import Granny2
+from .cache import ParseCache
+
+
+def process_pool(max_workers):
+    # type: (int) -> ProcessPoolExecutor
+    """
+    Returns a pool of max_workers worker processes for parsing GR2 files.
+    Blender can't be forked safely, so workers are always spawned, whatever
+    the platform's default start method.
+    """
+    return ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def parse_file(filepath, cache=None, import_collision=True):
+    # type: (str, Optional[ParseCache], bool) -> Union[Granny2, ValueError]
+    """
+    Reads a GR2 file into a picklable Granny2, with the buffers of the meshes
+    that will be built already decoded. Invalid files return their ValueError
+    instead of raising it, so that the caller can report them like a serial
+    import would.
+
+    :param cache: Parse cache to look the file up in before parsing it, and to
+    store it in afterwards.
+    :param import_collision: If False, collision meshes, which build() would
+    skip, are left out instead of being decoded.
+    """
+    if cache is not None:
+        gr2 = cache.get(filepath, import_collision)
+        if gr2 is not None:
+            return gr2
+
+    try:
+        gr2 = Granny2.read(filepath)
+    except ValueError as error:
+        return error
+
+    for i, mesh in list(gr2.mesh_buffer.items()):
+        if "collision" in mesh.name and not import_collision:
+            del gr2.mesh_buffer[i]
+        else:
+            mesh.detach()
+
+    if cache is not None:
+        cache.put(filepath, gr2, import_collision)
+    return gr2
+
+
+def convert_file(filepath, output_path, import_collision=True):
+    # type: (str, str, bool) -> Dict[str, Any]
+    """
+    Parses a GR2 file (see parse_file()) and pickles the resulting Granny2 to
+    output_path, for headless batch conversions (see io_scene_gr2/batch.py).
+    The pickle is written to a temporary file first, so an interrupted run never
+    leaves a truncated one behind.
+
+    :return: Record with the file's "status" ("ok" or "failed"), "error" message
+    if it failed, size in "bytes" and conversion time in "seconds".
+    """
+    start_time = time.perf_counter()
+    record = {"status": "ok", "bytes": 0}  # type: Dict[str, Any]
+
+    try:
+        record["bytes"] = os.path.getsize(filepath)
+        gr2 = parse_file(filepath, import_collision=import_collision)
+        if isinstance(gr2, ValueError):
+            raise gr2
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        with open(output_path + ".tmp", "wb") as file:
+            pickle.dump(gr2, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(output_path + ".tmp", output_path)
+    except Exception as error:
+        record["status"] = "failed"
+        record["error"] = f"{type(error).__name__}: {error}"
+
+    record["seconds"] = time.perf_counter() - start_time
+    return record
+
+
+def parse_files(filepaths, max_workers=None, cache=None, import_collision=True):
+    # type: (Sequence[str], Optional[int], Optional[ParseCache], bool) -> Iterator[Tuple[str, Union[Granny2, ValueError]]]
+    """
+    Parses GR2 files in a pool of worker processes, yielding (filepath, result)
+    pairs in the original order as soon as each result and those before it are
+    ready. See parse_file() for the results.
+
+    :param filepaths: The paths of the GR2 files to parse.
+    :param max_workers: Number of worker processes, all CPU cores if None or 0.
+    :param cache: Parse cache shared by the workers, if any.
+    :param import_collision: Whether collision meshes are kept (see parse_file()).
+    """
+    max_workers = min(max_workers or os.cpu_count() or 1, len(filepaths))
+    if max_workers <= 1:
+        for filepath in filepaths:
+            yield filepath, parse_file(filepath, cache, import_collision)
+        return
+
+    executor = process_pool(max_workers)
+    try:
+        yield from zip(filepaths, executor.map(partial(parse_file, cache=cache, import_collision=import_collision), filepaths))
+    finally:
+        # If the consumer stops early (e.g. at an invalid file), the files
+        # still queued are dropped instead of being parsed and thrown away.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def prefetch_files(filepaths, depth=4, cache=None, import_collision=True):
+    # type: (Sequence[str], int, Optional[ParseCache], bool) -> Iterator[Tuple[str, Union[Granny2, ValueError]]]
+    """
+    Parses GR2 files in a background thread, up to depth files ahead of the
+    consumer, yielding (filepath, result) pairs in the original order. This
+    overlaps disk reads and parsing with the bpy-side building of the previous
+    files. See parse_file() for the results; any other exception raised while
+    parsing a file is re-raised when its turn comes.
+
+    :param filepaths: The paths of the GR2 files to parse.
+    :param depth: Maximum number of parsed files waiting to be consumed.
+    :param cache: Parse cache to go through, if any.
+    :param import_collision: Whether collision meshes are kept (see parse_file()).
+    """
+    results = queue.Queue(maxsize=max(depth, 1))  # Bounded, to hold back the producer
+    stopped = threading.Event()
+
+    def produce():
+        # type: () -> None
+        for filepath in filepaths:
+            try:
+                item = (filepath, parse_file(filepath, cache, import_collision), None)
+            except Exception as error:
+                item = (filepath, None, error)
+
+            while not stopped.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            if stopped.is_set() or item[2] is not None:
+                return
+
+    producer = threading.Thread(target=produce, name="io_scene_gr2 prefetch", daemon=True)
+    producer.start()
+
+    try:
+        for _ in filepaths:
+            filepath, gr2, error = results.get()
+            if error is not None:
+                raise error
+            yield filepath, gr2
+    finally:
+        # Lets the producer finish if the consumer stops early
+        stopped.set()
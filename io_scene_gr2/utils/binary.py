@@ -4,9 +4,11 @@
 """
 
 from array import array
-from struct import pack_into, unpack_from
-from sys import maxsize
-from typing import Union
+from itertools import chain
+from mmap import ACCESS_READ, mmap
+from struct import Struct, calcsize, pack_into, unpack_from
+from sys import byteorder, maxsize
+from typing import Iterable, Union
 
 
 def ArrayBuffer(length=0):
@@ -31,21 +33,45 @@ def ArrayBuffer(length=0):
 	return array('B', bytes(int(length)))
 
 
+def MappedBuffer(filepath):
+	# type: (str) -> Union[array, mmap]
+	"""
+	Maps a file into memory as a read-only buffer which can be passed to a
+	DataView Object. Pages are only read from disk once they are accessed, so
+	sections of the file that are never touched are never loaded. Falls back to
+	an ArrayBuffer holding a copy of the file if it cannot be mapped, e.g. when
+	the file is empty.
+
+	:param filepath: The path of the file to map.
+	:type filepath: `str`
+
+	:return: Read-only memory map of the file, or an ArrayBuffer copy of it.
+	:rtype: Union[`array`, `mmap`]
+	"""
+	with open(filepath, 'rb') as file:
+		try:
+			return mmap(file.fileno(), 0, access=ACCESS_READ)
+		except (OSError, ValueError):
+			buffer = ArrayBuffer()
+			buffer.frombytes(file.read())
+			return buffer
+
+
 class DataView:
 	"""
 	"""
 
 	__slots__ = ("_bytes_buffer", "_bytes_length", "_bytes_offset")
 
-	_bytes_buffer: array
+	_bytes_buffer: Union[array, bytearray, bytes, memoryview, mmap]
 	_bytes_length: int
 	_bytes_offset: int
 
 	def __init__(self, buffer, byteOffset=0, byteLength=None):
-		# type: (array, Union[float, int], Union[float, int, None]) -> None
+		# type: (Union[array, bytearray, bytes, memoryview, mmap], Union[float, int], Union[float, int, None]) -> None
 
 		# PARAM CHECK: BUFFER
-		if not isinstance(buffer, array):
+		if not isinstance(buffer, (array, bytearray, bytes, memoryview, mmap)):
 			raise TypeError("First argument to DataView constructor must be an ArrayBuffer")
 
 		# PARAM CHECK: BYTEOFFSET
@@ -66,7 +92,7 @@ class DataView:
 
 	@property
 	def buffer(self):
-		# type: () -> array
+		# type: () -> Union[array, bytearray, bytes, memoryview, mmap]
 		return self._bytes_buffer
 
 	@property
@@ -107,6 +133,113 @@ class DataView:
 
 		pack_into(t_chr, self._bytes_buffer, self._bytes_offset + offset, value)
 
+	def _set_array(self, offset, values, t_chr, littleEndian):
+		# type: (Union[float, int], Iterable[Union[float, int]], str, bool) -> None
+
+		if not (isinstance(values, array) and values.typecode == t_chr):
+			values = array(t_chr, values)
+
+		t_len = values.itemsize
+
+		# PARAM CHECK: BYTE OFFSET
+		if not isinstance(offset, (float, int)):
+			offset = 0
+		elif (offset < 0) or (self._bytes_length < (self._bytes_offset + offset + len(values) * t_len)):
+			raise IndexError("Offset is outside the bounds of the DataView")
+
+		if t_len > 1 and littleEndian != (byteorder == 'little'):
+			values = array(t_chr, values)
+			values.byteswap()
+
+		start = self._bytes_offset + int(offset)
+		with memoryview(self._bytes_buffer) as view:
+			view[start:start + len(values) * t_len] = values.tobytes()
+
+	def _set_strided(self, offset, values, stride, t_chr, components, littleEndian):
+		# type: (Union[float, int], Iterable[Union[float, int]], int, str, int, bool) -> None
+
+		if not (isinstance(values, array) and values.typecode == t_chr):
+			values = array(t_chr, values)
+
+		t_len = values.itemsize * components
+		count = len(values) // components
+
+		if stride == t_len:
+			return self._set_array(offset, values, t_chr, littleEndian)
+
+		# PARAM CHECK: BYTE OFFSET AND STRIDE
+		if not isinstance(offset, (float, int)):
+			offset = 0
+		if count == 0:
+			return
+		elif stride < t_len:
+			raise IndexError(f"Invalid stride {stride}")
+		elif (offset < 0) or (self._bytes_length < (self._bytes_offset + offset + (count - 1) * stride + t_len)):
+			raise IndexError("Offset is outside the bounds of the DataView")
+
+		if values.itemsize > 1 and littleEndian != (byteorder == 'little'):
+			values = array(t_chr, values)
+			values.byteswap()
+
+		# Every byte of the field is scattered to its records with one strided slice assignment.
+		start = self._bytes_offset + int(offset)
+		end = start + (count - 1) * stride + 1
+		with memoryview(self._bytes_buffer) as view, memoryview(values.tobytes()) as data:
+			for i in range(t_len):
+				view[start + i:end + i:stride] = data[i:count * t_len:t_len]
+
+	def _get_array(self, offset, length, t_chr, littleEndian):
+		# type: (Union[float, int], int, str, bool) -> array
+
+		t_len = calcsize('<' + t_chr)
+
+		# PARAM CHECK: BYTE OFFSET AND LENGTH
+		if not isinstance(offset, (float, int)):
+			offset = 0
+		if length < 0:
+			raise IndexError(f"Invalid array length {length}")
+		elif (offset < 0) or (self._bytes_length < (self._bytes_offset + offset + length * t_len)):
+			raise IndexError("Offset is outside the bounds of the DataView")
+
+		start = self._bytes_offset + int(offset)
+		values = array(t_chr)
+		with memoryview(self._bytes_buffer) as view:
+			values.frombytes(view[start:start + length * t_len])
+
+		if t_len > 1 and littleEndian != (byteorder == 'little'):
+			values.byteswap()
+
+		return values
+
+	def _get_strided(self, offset, count, stride, t_chr, components, littleEndian):
+		# type: (Union[float, int], int, int, str, int, bool) -> array
+
+		t_len = calcsize('<' + t_chr) * components
+
+		if stride == t_len:
+			return self._get_array(offset, count * components, t_chr, littleEndian)
+
+		# PARAM CHECK: BYTE OFFSET, COUNT AND STRIDE
+		if not isinstance(offset, (float, int)):
+			offset = 0
+		if count == 0:
+			return array(t_chr)
+		elif count < 0 or stride < t_len:
+			raise IndexError(f"Invalid record count {count} or stride {stride}")
+		elif (offset < 0) or (self._bytes_length < (self._bytes_offset + offset + (count - 1) * stride + t_len)):
+			raise IndexError("Offset is outside the bounds of the DataView")
+
+		start = self._bytes_offset + int(offset)
+		record = Struct(f"{'<' if littleEndian else '>'}{components}{t_chr}{stride - t_len}x")
+		with memoryview(self._bytes_buffer) as view:
+			data = view[start:start + count * stride]
+
+			# The padding of the last record may lie past the end of the buffer.
+			if len(data) < count * stride:
+				data = data.tobytes() + bytes(count * stride - len(data))
+
+			return array(t_chr, chain.from_iterable(record.iter_unpack(data)))
+
 	def getBigInt64(self, byteOffset, littleEndian=False):
 		# type: (int, bool) -> int
 		"""
@@ -155,6 +288,24 @@ class DataView:
 		"""
 		return self._get_value(byteOffset, '<f' if littleEndian else '>f', 4)
 
+	def getFloat32Array(self, byteOffset, length, littleEndian=False):
+		# type: (int, int, bool) -> array
+		"""
+		Gets `length` consecutive `Float32` values starting at the specified byte offset from the
+		start of the view, with a single bounds check for the whole range.
+
+		:param byteOffset: The place in the buffer at which the first value should be retrieved.
+		:type  byteOffset: `int`
+		:param length: The number of values to retrieve.
+		:type  length: `int`
+		:param littleEndian: If false or undefined, big-endian values should be read, otherwise
+		little-endian values should be read.
+		:type  littleEndian: `bool`
+		:rtype: `array`
+		:return: `Float32` values at the specified byte offset, as an array of type 'f'.
+		"""
+		return self._get_array(byteOffset, length, 'f', littleEndian)
+
 	def getFloat64(self, byteOffset, littleEndian=False):
 		# type: (int, bool) -> float
 		"""
@@ -219,6 +370,50 @@ class DataView:
 		"""
 		return self._get_value(byteOffset, '<i' if littleEndian else '>i', 4)
 
+	def getInt32Array(self, byteOffset, length, littleEndian=False):
+		# type: (int, int, bool) -> array
+		"""
+		Gets `length` consecutive `Int32` values starting at the specified byte offset from the
+		start of the view, with a single bounds check for the whole range.
+
+		:param byteOffset: The place in the buffer at which the first value should be retrieved.
+		:type  byteOffset: `int`
+		:param length: The number of values to retrieve.
+		:type  length: `int`
+		:param littleEndian: If false or undefined, big-endian values should be read, otherwise
+		little-endian values should be read.
+		:type  littleEndian: `bool`
+		:rtype: `array`
+		:return: `Int32` values at the specified byte offset, as an array of type 'i'.
+		"""
+		return self._get_array(byteOffset, length, 'i', littleEndian)
+
+	def getStridedArray(self, byteOffset, count, byteStride, typeCode, components=1, littleEndian=False):
+		# type: (int, int, int, str, int, bool) -> array
+		"""
+		Gets the values of one field from `count` interleaved records of `byteStride` bytes each,
+		the first of them starting at the specified byte offset from the start of the view. The
+		whole range is bounds-checked once and unpacked in a single pass.
+
+		:param byteOffset: The place in the buffer at which the first record's field starts.
+		:type  byteOffset: `int`
+		:param count: The number of records to read.
+		:type  count: `int`
+		:param byteStride: The distance, in bytes, between the starts of consecutive records.
+		:type  byteStride: `int`
+		:param typeCode: `array` type code of the field's components ('b', 'B', 'h', 'H', 'i', 'I',
+		'f' or 'd').
+		:type  typeCode: `str`
+		:param components: The number of consecutive values that make up the field.
+		:type  components: `int`
+		:param littleEndian: If false or undefined, big-endian values should be read, otherwise
+		little-endian values should be read.
+		:type  littleEndian: `bool`
+		:rtype: `array`
+		:return: `count * components` values, record after record.
+		"""
+		return self._get_strided(byteOffset, count, byteStride, typeCode, components, littleEndian)
+
 	def getUint8(self, byteOffset):
 		# type: (int) -> int
 		"""
@@ -235,6 +430,21 @@ class DataView:
 		"""
 		return self._get_value(byteOffset, 'B', 1)
 
+	def getUint8Array(self, byteOffset, length):
+		# type: (int, int) -> array
+		"""
+		Gets `length` consecutive `Uint8` values starting at the specified byte offset from the
+		start of the view, with a single bounds check for the whole range.
+
+		:param byteOffset: The place in the buffer at which the first value should be retrieved.
+		:type  byteOffset: `int`
+		:param length: The number of values to retrieve.
+		:type  length: `int`
+		:rtype: `array`
+		:return: `Uint8` values at the specified byte offset, as an array of type 'B'.
+		"""
+		return self._get_array(byteOffset, length, 'B', True)
+
 	def getUint16(self, byteOffset, littleEndian=False):
 		# type: (int, bool) -> int
 		"""
@@ -251,6 +461,24 @@ class DataView:
 		"""
 		return self._get_value(byteOffset, '<H' if littleEndian else '>H', 2)
 
+	def getUint16Array(self, byteOffset, length, littleEndian=False):
+		# type: (int, int, bool) -> array
+		"""
+		Gets `length` consecutive `Uint16` values starting at the specified byte offset from the
+		start of the view, with a single bounds check for the whole range.
+
+		:param byteOffset: The place in the buffer at which the first value should be retrieved.
+		:type  byteOffset: `int`
+		:param length: The number of values to retrieve.
+		:type  length: `int`
+		:param littleEndian: If false or undefined, big-endian values should be read, otherwise
+		little-endian values should be read.
+		:type  littleEndian: `bool`
+		:rtype: `array`
+		:return: `Uint16` values at the specified byte offset, as an array of type 'H'.
+		"""
+		return self._get_array(byteOffset, length, 'H', littleEndian)
+
 	def getUint32(self, byteOffset, littleEndian=False):
 		# type: (int, bool) -> int
 		"""
@@ -267,6 +495,24 @@ class DataView:
 		"""
 		return self._get_value(byteOffset, '<I' if littleEndian else '>I', 4)
 
+	def getUint32Array(self, byteOffset, length, littleEndian=False):
+		# type: (int, int, bool) -> array
+		"""
+		Gets `length` consecutive `Uint32` values starting at the specified byte offset from the
+		start of the view, with a single bounds check for the whole range.
+
+		:param byteOffset: The place in the buffer at which the first value should be retrieved.
+		:type  byteOffset: `int`
+		:param length: The number of values to retrieve.
+		:type  length: `int`
+		:param littleEndian: If false or undefined, big-endian values should be read, otherwise
+		little-endian values should be read.
+		:type  littleEndian: `bool`
+		:rtype: `array`
+		:return: `Uint32` values at the specified byte offset, as an array of type 'I'.
+		"""
+		return self._get_array(byteOffset, length, 'I', littleEndian)
+
 	def getUint64(self, byteOffset, littleEndian=False):
 		# type: (int, bool) -> int
 		"""
@@ -331,6 +577,23 @@ class DataView:
 		return self._set_value(byteOffset, value, '<f' if littleEndian else '>f', 4,
 							   -3.40282346638528859e+38, 3.40282346638528859e+38)
 
+
+	def setFloat32Array(self, byteOffset, values, littleEndian=False):
+		# type: (int, Iterable[float], bool) -> None
+		"""
+		Stores consecutive `Float32` values starting at the specified byte offset from the start of
+		the view, with a single bounds check for the whole range.
+
+		:param byteOffset: The place in the buffer at which the first value should be set.
+		:type byteOffset: `int`
+		:param values: The values to set.
+		:type values: Iterable[`float`]
+		:param littleEndian: If false or undefined, big-endian values should be written,
+		otherwise little-endian values should be written.
+		:type littleEndian: `bool`
+		"""
+		return self._set_array(byteOffset, values, 'f', littleEndian)
+
 	def setFloat64(self, byteOffset, value, littleEndian=False):
 		# type: (int, float, bool) -> None
 		"""
@@ -390,6 +653,30 @@ class DataView:
 		return self._set_value(byteOffset, value, '<i' if littleEndian else '>i', 4, -2147483648,
 							   2147483647)
 
+	def setStridedArray(self, byteOffset, values, byteStride, typeCode, components=1, littleEndian=False):
+		# type: (int, Iterable[Union[float, int]], int, str, int, bool) -> None
+		"""
+		Stores the values of one field into `len(values) / components` interleaved records of
+		`byteStride` bytes each, the first of them starting at the specified byte offset from the
+		start of the view, leaving the bytes between the fields untouched.
+
+		:param byteOffset: The place in the buffer at which the first record's field starts.
+		:type byteOffset: `int`
+		:param values: The values to set, record after record.
+		:type values: Iterable[Union[`float`, `int`]]
+		:param byteStride: The distance, in bytes, between the starts of consecutive records.
+		:type byteStride: `int`
+		:param typeCode: `array` type code of the field's components ('b', 'B', 'h', 'H', 'i', 'I',
+		'f' or 'd').
+		:type typeCode: `str`
+		:param components: The number of consecutive values that make up the field.
+		:type components: `int`
+		:param littleEndian: If false or undefined, big-endian values should be written,
+		otherwise little-endian values should be written.
+		:type littleEndian: `bool`
+		"""
+		return self._set_strided(byteOffset, values, byteStride, typeCode, components, littleEndian)
+
 	def setUint8(self, byteOffset, value):
 		# type: (int, int) -> None
 		"""
@@ -402,6 +689,20 @@ class DataView:
 		"""
 		return self._set_value(byteOffset, value, 'B', 1, 0, 255)
 
+
+	def setUint8Array(self, byteOffset, values):
+		# type: (int, Iterable[int]) -> None
+		"""
+		Stores consecutive `Uint8` values starting at the specified byte offset from the start of
+		the view, with a single bounds check for the whole range.
+
+		:param byteOffset: The place in the buffer at which the first value should be set.
+		:type byteOffset: `int`
+		:param values: The values to set.
+		:type values: Iterable[`int`]
+		"""
+		return self._set_array(byteOffset, values, 'B', False)
+
 	def setUint16(self, byteOffset, value, littleEndian=False):
 		# type: (int, int, bool) -> None
 		"""
@@ -417,6 +718,23 @@ class DataView:
 		"""
 		return self._set_value(byteOffset, value, '<H' if littleEndian else '>H', 2, 0, 65535)
 
+
+	def setUint16Array(self, byteOffset, values, littleEndian=False):
+		# type: (int, Iterable[int], bool) -> None
+		"""
+		Stores consecutive `Uint16` values starting at the specified byte offset from the start of
+		the view, with a single bounds check for the whole range.
+
+		:param byteOffset: The place in the buffer at which the first value should be set.
+		:type byteOffset: `int`
+		:param values: The values to set.
+		:type values: Iterable[`int`]
+		:param littleEndian: If false or undefined, big-endian values should be written,
+		otherwise little-endian values should be written.
+		:type littleEndian: `bool`
+		"""
+		return self._set_array(byteOffset, values, 'H', littleEndian)
+
 	def setUint32(self, byteOffset, value, littleEndian=False):
 		# type: (int, int, bool) -> None
 		"""
@@ -431,6 +749,23 @@ class DataView:
 		:type littleEndian: `bool`
 		"""
 		return self._set_value(byteOffset, value, '<I' if littleEndian else '>I', 4, 0, 4294967295)
+
+	def setUint32Array(self, byteOffset, values, littleEndian=False):
+		# type: (int, Iterable[int], bool) -> None
+		"""
+		Stores consecutive `Uint32` values starting at the specified byte offset from the start of
+		the view, with a single bounds check for the whole range.
+
+		:param byteOffset: The place in the buffer at which the first value should be set.
+		:type byteOffset: `int`
+		:param values: The values to set.
+		:type values: Iterable[`int`]
+		:param littleEndian: If false or undefined, big-endian values should be written,
+		otherwise little-endian values should be written.
+		:type littleEndian: `bool`
+		"""
+		return self._set_array(byteOffset, values, 'I', littleEndian)
+
 	def setUint64(self, byteOffset, value, littleEndian=False):
 		# type: (int, int, bool) -> None
 		"""
@@ -446,4 +781,71 @@ class DataView:
 		"""
 		return self._set_value(byteOffset, value, '<Q' if littleEndian else '>Q', 8, 0, 18446744073709551615)
 	
-	
\ No newline at end of file
+	
+
+_INT8 = Struct('b')
+_UINT8 = Struct('B')
+_INT16 = (Struct('>h'), Struct('<h'))
+_UINT16 = (Struct('>H'), Struct('<H'))
+_INT32 = (Struct('>i'), Struct('<i'))
+_UINT32 = (Struct('>I'), Struct('<I'))
+_INT64 = (Struct('>q'), Struct('<q'))
+_UINT64 = (Struct('>Q'), Struct('<Q'))
+_FLOAT32 = (Struct('>f'), Struct('<f'))
+_FLOAT64 = (Struct('>d'), Struct('<d'))
+
+
+class UncheckedDataView(DataView):
+	"""
+	DataView for buffers whose layout has already been validated, e.g. by
+	Granny2.validate(). The scalar getters skip the parameter and bounds checks
+	and unpack through precompiled Struct objects. A read past the end of the
+	buffer raises struct.error instead of IndexError. Bulk getters and all setters
+	are inherited unchanged.
+	"""
+
+	__slots__ = ()
+
+	def getBigInt64(self, byteOffset, littleEndian=False):
+		# type: (int, bool) -> int
+		return _INT64[bool(littleEndian)].unpack_from(self._bytes_buffer, self._bytes_offset + byteOffset)[0]
+
+	def getBigUint64(self, byteOffset, littleEndian=False):
+		# type: (int, bool) -> int
+		return _UINT64[bool(littleEndian)].unpack_from(self._bytes_buffer, self._bytes_offset + byteOffset)[0]
+
+	def getFloat32(self, byteOffset, littleEndian=False):
+		# type: (int, bool) -> float
+		return _FLOAT32[bool(littleEndian)].unpack_from(self._bytes_buffer, self._bytes_offset + byteOffset)[0]
+
+	def getFloat64(self, byteOffset, littleEndian=False):
+		# type: (int, bool) -> float
+		return _FLOAT64[bool(littleEndian)].unpack_from(self._bytes_buffer, self._bytes_offset + byteOffset)[0]
+
+	def getInt8(self, byteOffset):
+		# type: (int) -> int
+		return _INT8.unpack_from(self._bytes_buffer, self._bytes_offset + byteOffset)[0]
+
+	def getInt16(self, byteOffset, littleEndian=False):
+		# type: (int, bool) -> int
+		return _INT16[bool(littleEndian)].unpack_from(self._bytes_buffer, self._bytes_offset + byteOffset)[0]
+
+	def getInt32(self, byteOffset, littleEndian=False):
+		# type: (int, bool) -> int
+		return _INT32[bool(littleEndian)].unpack_from(self._bytes_buffer, self._bytes_offset + byteOffset)[0]
+
+	def getUint8(self, byteOffset):
+		# type: (int) -> int
+		return _UINT8.unpack_from(self._bytes_buffer, self._bytes_offset + byteOffset)[0]
+
+	def getUint16(self, byteOffset, littleEndian=False):
+		# type: (int, bool) -> int
+		return _UINT16[bool(littleEndian)].unpack_from(self._bytes_buffer, self._bytes_offset + byteOffset)[0]
+
+	def getUint32(self, byteOffset, littleEndian=False):
+		# type: (int, bool) -> int
+		return _UINT32[bool(littleEndian)].unpack_from(self._bytes_buffer, self._bytes_offset + byteOffset)[0]
+
+	def getUint64(self, byteOffset, littleEndian=False):
+		# type: (int, bool) -> int
+		return _UINT64[bool(littleEndian)].unpack_from(self._bytes_buffer, self._bytes_offset + byteOffset)[0]
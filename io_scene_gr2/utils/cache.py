@@ -0,0 +1,175 @@
+# <pep8 compliant>
+
+"""
+Persistent on-disk cache of parsed GR2 files.
+
+Entries are pickled Granny2 objects whose meshes are already decoded into one
+column per vertex attribute, so that a warm import skips the parser entirely.
+They are keyed by the file's path, size, modification time and content hash
+(plus whether its collision meshes were kept, see utils.batch.parse_file()),
+and evicted least recently used first once the cache outgrows its size cap.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from mmap import mmap
+from typing import List, Optional, Tuple
+
+from .binary import MappedBuffer
+from ..types.gr2 import Granny2
+
+
+# Bump whenever Granny2 or its decoded columns change, to invalidate old entries.
+CACHE_VERSION = 2
+
+_ENTRY_EXTENSION = ".gr2cache"
+
+
+def content_hash(filepath):
+    # type: (str) -> str
+    """
+    Returns the SHA-1 hex digest of a file's contents, closing the file
+    mapping right away (an open mapping keeps the file locked on Windows).
+    """
+    buffer = MappedBuffer(filepath)
+    try:
+        return hashlib.sha1(buffer).hexdigest()
+    finally:
+        if isinstance(buffer, mmap):
+            buffer.close()
+
+
+class ParseCache:
+    """
+    A cache directory holding at most max_size bytes of entries. Instances are
+    picklable, so they can be handed to the worker processes of utils.batch.
+    """
+
+    __slots__ = ("directory", "max_size")
+
+    def __init__(self, directory, max_size):
+        # type: (str, int) -> None
+        self.directory = directory  # type: str
+        self.max_size = max_size  # type: int
+
+    def key(self, filepath, import_collision=True):
+        # type: (str, bool) -> str
+        """
+        Returns the entry name for the current contents of a GR2 file, parsed
+        with or without its collision meshes.
+        """
+        stat = os.stat(filepath)
+        digest = content_hash(filepath)
+        key = f"{CACHE_VERSION}|{os.path.abspath(filepath)}|{stat.st_size}|{stat.st_mtime_ns}|{digest}|{import_collision:d}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest() + _ENTRY_EXTENSION
+
+    def get(self, filepath, import_collision=True):
+        # type: (str, bool) -> Optional[Granny2]
+        """
+        Returns the cached Granny2 of a GR2 file, or None if it isn't cached (or
+        its entry is unreadable, which is then discarded).
+        """
+        entry_path = os.path.join(self.directory, self.key(filepath, import_collision))
+        try:
+            with open(entry_path, "rb") as file:
+                gr2 = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self._remove(entry_path)
+            return None
+
+        if not isinstance(gr2, Granny2):
+            self._remove(entry_path)
+            return None
+
+        # Marks the entry as recently used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return gr2
+
+    def put(self, filepath, gr2, import_collision=True):
+        # type: (str, Granny2, bool) -> None
+        """
+        Stores the Granny2 of a GR2 file, whose meshes must have been detached
+        (see Granny2.Mesh.detach()), then evicts entries beyond the size cap.
+        Entries are written to a temporary file first, so that concurrent
+        writers and interruptions never leave a truncated one behind.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        entry_path = os.path.join(self.directory, self.key(filepath, import_collision))
+
+        descriptor, temp_path = tempfile.mkstemp(".tmp", dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump(gr2, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, entry_path)
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+        self.evict()
+
+    def entries(self):
+        # type: () -> List[Tuple[int, int, str]]
+        """
+        Returns the (mtime, size, path) of every entry, least recently used first.
+        """
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(_ENTRY_EXTENSION):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except FileNotFoundError:
+            pass
+        entries.sort()
+        return entries
+
+    def size(self):
+        # type: () -> int
+        """
+        Returns the total size of the cache's entries in bytes.
+        """
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        # type: () -> None
+        """
+        Removes the least recently used entries until the cache fits its size cap.
+        """
+        entries = self.entries()
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            self._remove(path)
+            total_size -= size
+
+    def clear(self):
+        # type: () -> int
+        """
+        Removes all the entries. Returns the number of bytes freed.
+        """
+        freed = 0
+        for _, size, path in self.entries():
+            if self._remove(path):
+                freed += size
+        return freed
+
+    @staticmethod
+    def _remove(path):
+        # type: (str) -> bool
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
@@ -1,6 +1,13 @@
 # <pep8 compliant>
 
+from array import array
 from struct import pack, unpack
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def decodeHalfFloat(arg):
@@ -8,6 +15,39 @@ def decodeHalfFloat(arg):
     return unpack('<e', pack('<H', arg))[0]
 
 
+def decodeHalfFloatArray(args):
+    # type: (Sequence[int]) -> array
+    """
+    Decodes a sequence of half-float bit patterns into an array of type 'f',
+    reinterpreting the whole sequence at once instead of one value at a time.
+    """
+    if np is not None:
+        return array('f', np.asarray(args, np.uint16).view(np.float16).astype(np.float32).tobytes())
+
+    if not (isinstance(args, array) and args.typecode == 'H'):
+        args = array('H', args)
+    return array('f', unpack(f'={len(args)}e', args.tobytes()))
+
+
 def encodeHalfFloat(arg):
     # type: (float) -> int
     return unpack('<H', pack('<e', arg))[0]
+
+
+def encodeHalfFloatArray(args):
+    # type: (Sequence[float]) -> array
+    """
+    Encodes a sequence of floats into an array of type 'H' holding their
+    half-float bit patterns, converting the whole sequence at once. Like
+    encodeHalfFloat, raises OverflowError for finite values beyond the
+    half-float range.
+    """
+    if np is not None:
+        values = np.asarray(args, np.float32)
+        with np.errstate(over='ignore'):
+            halves = values.astype(np.float16)
+        if np.any(np.isinf(halves) & np.isfinite(values)):
+            raise OverflowError("float too large to pack with e format")
+        return array('H', halves.view(np.uint16).tobytes())
+
+    return array('H', pack(f'={len(args)}e', *args))
@@ -1,6 +1,7 @@
 # <pep8 compliant>
 
 import os
+from typing import Dict
 
 from .binary import DataView
 
@@ -23,6 +24,36 @@ def path_split(path):
 	return filename
 
 
+def _find_terminator(dv, pos):
+	# type: (DataView, int) -> int
+	"""
+	Returns the absolute buffer offset of the first NUL byte at or after pos.
+	"""
+	if (pos < 0) or (dv.byteLength <= pos):
+		raise IndexError("Offset is outside the bounds of the DataView")
+
+	buffer = dv.buffer
+	start = dv.byteOffset + pos
+	end = dv.byteOffset + dv.byteLength
+
+	# bytes, bytearray and mmap can be searched directly
+	if hasattr(buffer, "find"):
+		stop = buffer.find(b'\0', start, end)
+	else:
+		stop = -1
+		with memoryview(buffer) as view:
+			for chunk_start in range(start, end, 64):
+				index = view[chunk_start:min(chunk_start + 64, end)].tobytes().find(b'\0')
+				if index >= 0:
+					stop = chunk_start + index
+					break
+
+	if stop < 0:
+		raise IndexError("Offset is outside the bounds of the DataView")
+
+	return stop
+
+
 def readString(dv, posIn, posOverride=None):
 	# type: (DataView, int, int|None) -> str
 	
@@ -31,28 +62,46 @@ def readString(dv, posIn, posOverride=None):
 		pos = dv.getUint32(posIn, True)
 	else:
 		pos = posOverride
-	
-	outString = ""
-	curChar = dv.getUint8(pos)
-	pos += 1
 
-	while curChar != 0:
-		outString += chr(curChar)
-		curChar = dv.getUint8(pos)
-		pos += 1
-
-	return outString
+	return readCString(dv, pos)
 
 
 def readCString(dv, pos):
 	# type: (DataView, int) -> str
-	outString = ""
-	curChar = dv.getUint8(pos)
-	pos += 1
+	start = dv.byteOffset + pos
+	stop = _find_terminator(dv, pos)
+
+	with memoryview(dv.buffer) as view:
+		return view[start:stop].tobytes().decode('latin-1')
+
+
+class StringTable:
+	"""
+	Reads NUL-terminated strings from a DataView, caching every string by its
+	offset so that names referenced more than once (e.g. the same bone names in
+	several per-mesh bone tables) are only decoded once per file.
+	"""
+
+	__slots__ = ("_cache", "_dv")
+
+	_cache: Dict[int, str]
+	_dv: DataView
+
+	def __init__(self, dv):
+		# type: (DataView) -> None
+		self._cache = {}
+		self._dv = dv
 
-	while curChar != 0:
-		outString += chr(curChar)
-		curChar = dv.getUint8(pos)
-		pos += 1
+	def readString(self, posIn, posOverride=None):
+		# type: (int, int|None) -> str
+		if posOverride is None:
+			return self.readCString(self._dv.getUint32(posIn, True))
+		else:
+			return self.readCString(posOverride)
 
-	return outString
+	def readCString(self, pos):
+		# type: (int) -> str
+		string = self._cache.get(pos)
+		if string is None:
+			string = self._cache[pos] = readCString(self._dv, pos)
+		return string
@@ -0,0 +1,195 @@
+# <pep8 compliant>
+
+from array import array
+from math import sqrt
+from typing import Dict, List, Sequence, Tuple, Union
+
+from .binary import DataView
+from .number import decodeHalfFloatArray, encodeHalfFloatArray
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Vertex attributes in the order they are interleaved in a GR2 vertex buffer:
+# (name, bit_flag2 bit, struct type code, NumPy type, components)
+VERTEX_ATTRIBUTES = (
+    ("position",     0,   'f', '<f4', 3),
+    ("bone_weights", 256, 'B', 'u1',  4),  # 0x100
+    ("bone_indices", 256, 'B', 'u1',  4),  # 0x100
+    ("normals",      2,   'B', 'u1',  4),  # 0x02
+    ("tangents",     2,   'B', 'u1',  4),  # 0x02
+    ("color",        16,  'B', 'u1',  4),  # 0x10
+    ("uv_layer0",    32,  'H', '<f2', 2),  # 0x20
+    ("uv_layer1",    64,  'H', '<f2', 2),  # 0x40
+    ("uv_layer2",    128, 'H', '<f2', 2),  # 0x80
+)
+
+_TYPE_SIZES = {'f': 4, 'B': 1, 'H': 2}
+
+
+def vertex_layout(bit_flag2):
+    # type: (int) -> List[Tuple[str, int, str, str, int]]
+    """
+    Returns the (name, offset, struct type code, NumPy type, components) of every
+    attribute present in a vertex with the given bit_flag2. The layout is the
+    same for v4 (32-bit) and v5 (64-bit) files, only the mesh headers differ.
+    """
+    layout = []
+    offset = 0
+    for name, flag, t_chr, np_type, components in VERTEX_ATTRIBUTES:
+        if flag and not bit_flag2 & flag:
+            continue
+        layout.append((name, offset, t_chr, np_type, components))
+        offset += _TYPE_SIZES[t_chr] * components
+    return layout
+
+
+def vertex_layout_size(bit_flag2):
+    # type: (int) -> int
+    """
+    Returns the number of bytes taken by the attributes of a vertex with the given
+    bit_flag2, excluding any padding up to the vertex_size stored in the file.
+    """
+    return sum(_TYPE_SIZES[t_chr] * components for _, _, t_chr, _, components in vertex_layout(bit_flag2))
+
+
+def vertex_dtype(bit_flag2, vertex_size):
+    # type: (int, int) -> np.dtype
+    """
+    Builds a NumPy structured dtype for one vertex of the given bit_flag2, padded
+    to vertex_size bytes so that unknown trailing attributes are skipped.
+    """
+    layout = vertex_layout(bit_flag2)
+    return np.dtype({
+        "names":    [name for name, _, _, _, _ in layout],
+        "formats":  [(np_type, (components,)) for _, _, _, np_type, components in layout],
+        "offsets":  [offset for _, offset, _, _, _ in layout],
+        "itemsize": vertex_size,
+    })
+
+
+def decode_vertex_buffer(dv, offset, num_vertices, bit_flag2, vertex_size):
+    # type: (DataView, int, int, int, int) -> Dict[str, Union[array, np.ndarray]]
+    """
+    Decodes an interleaved GR2 vertex buffer into one flat column per attribute,
+    keyed by attribute name ("position" ... "uv_layer2"). Half-float UVs are
+    widened to floats.
+    Uses a single np.frombuffer when NumPy is available, and strided reads
+    through the DataView otherwise.
+    """
+    layout = vertex_layout(bit_flag2)
+    if not num_vertices:
+        # Nothing to read, whatever the vertex size (possibly 0)
+        return {name: array('f' if t_chr == 'H' else t_chr) for name, _, t_chr, _, _ in layout}
+
+    layout_size = vertex_layout_size(bit_flag2)
+    end = dv.byteOffset + offset + num_vertices * vertex_size
+
+    if np is not None and layout_size <= vertex_size and end <= dv.byteOffset + dv.byteLength:
+        records = np.frombuffer(dv.buffer, vertex_dtype(bit_flag2, vertex_size), num_vertices, dv.byteOffset + offset)
+        columns = {}
+        for name, _, t_chr, _, _ in layout:
+            columns[name] = np.array(records[name], np.float32 if t_chr == 'H' else None).reshape(-1)
+        return columns
+
+    columns = {}
+    for name, attribute_offset, t_chr, _, components in layout:
+        column = dv.getStridedArray(offset + attribute_offset, num_vertices, vertex_size, t_chr, components, True)
+        columns[name] = decodeHalfFloatArray(column) if t_chr == 'H' else column
+    return columns
+
+
+def encode_vertex_buffer(dv, offset, columns, bit_flag2, vertex_size):
+    # type: (DataView, int, Dict[str, Union[array, np.ndarray]], int, int) -> None
+    """
+    Interleaves the per-attribute columns of a vertex buffer, keyed like the ones
+    returned by decode_vertex_buffer, into the DataView. Float UVs are narrowed to
+    half floats. Uses a single structured NumPy array when NumPy is available,
+    and strided writes through the DataView otherwise.
+    """
+    layout = vertex_layout(bit_flag2)
+    num_vertices = len(columns["position"]) // 3
+
+    if np is not None:
+        records = np.zeros(num_vertices, vertex_dtype(bit_flag2, vertex_size))
+        for name, _, t_chr, _, components in layout:
+            column = columns[name]
+            if t_chr == 'H':
+                # Narrowed like in the fallback, raising on half-float overflows
+                column = np.frombuffer(encodeHalfFloatArray(column), np.float16)
+            records[name] = np.asarray(column).reshape(num_vertices, components)
+        dv.setUint8Array(offset, array('B', records.tobytes()))
+        return
+
+    for name, attribute_offset, t_chr, _, components in layout:
+        column = encodeHalfFloatArray(columns[name]) if t_chr == 'H' else columns[name]
+        dv.setStridedArray(offset + attribute_offset, column, vertex_size, t_chr, components, True)
+
+
+def loop_uvs(uvs, indices):
+    # type: (Union[array, np.ndarray], Sequence[int]) -> Union[array, np.ndarray]
+    """
+    Gathers a flat per-vertex UV column into loop order, one (u, v) pair per entry
+    of the triangle index buffer, flipping v (1 - v) from GR2 to Blender space.
+    The result can be passed to a Blender uv_layer.data.foreach_set("uv", ...).
+    """
+    if np is not None:
+        gathered = np.asarray(uvs, np.float32).reshape(-1, 2)[np.asarray(indices, np.intp)]
+        gathered[:, 1] = 1 - gathered[:, 1]
+        return gathered.reshape(-1)
+
+    gathered = array('f', bytes(8 * len(indices)))
+    gathered[0::2] = array('f', [uvs[v * 2] for v in indices])
+    gathered[1::2] = array('f', [1 - uvs[v * 2 + 1] for v in indices])
+    return gathered
+
+
+def vertex_normals(normals):
+    # type: (Union[array, np.ndarray]) -> Union[np.ndarray, List[Tuple[float, float, float]]]
+    """
+    Decodes a flat uint8 x 4 normals column into one normalized (x, y, z) per
+    vertex, as accepted by Blender's normals_split_custom_set_from_vertices().
+    Zero-length normals are left as zero vectors.
+    """
+    if np is not None:
+        decoded = (np.asarray(normals, np.float32).reshape(-1, 4)[:, :3] - 127) / 127
+        lengths = np.linalg.norm(decoded, axis=1, keepdims=True)
+        return np.divide(decoded, lengths, out=np.zeros_like(decoded), where=lengths > 0)
+
+    decoded = []
+    for i in range(0, len(normals), 4):
+        x, y, z = ((co - 127) / 127 for co in normals[i:i + 3])
+        length = sqrt(x * x + y * y + z * z)
+        decoded.append((x / length, y / length, z / length) if length else (0.0, 0.0, 0.0))
+    return decoded
+
+
+def check_triangles(indices, num_vertices):
+    # type: (Sequence[int], int) -> Dict[str, int]
+    """
+    Counts the triangles of an index buffer that Blender's Mesh.validate() would
+    have to fix: those referencing vertices past num_vertices ("out_of_range"),
+    those using a vertex more than once ("degenerate"), and those repeating the
+    vertices of an earlier triangle in any order ("duplicate").
+    """
+    num_triangles = len(indices) // 3
+
+    if np is not None:
+        triangles = np.asarray(indices[:num_triangles * 3], np.int64).reshape(-1, 3)
+        triangles.sort(axis=1)
+        degenerate = (triangles[:, 0] == triangles[:, 1]) | (triangles[:, 1] == triangles[:, 2])
+        return {
+            "out_of_range": int(np.count_nonzero(triangles[:, 2] >= num_vertices)),
+            "degenerate":   int(np.count_nonzero(degenerate)),
+            "duplicate":    num_triangles - len(np.unique(triangles, axis=0)) if num_triangles else 0,
+        }
+
+    triangles = [tuple(sorted(indices[i:i + 3])) for i in range(0, num_triangles * 3, 3)]
+    return {
+        "out_of_range": sum(1 for triangle in triangles if triangle[2] >= num_vertices),
+        "degenerate":   sum(1 for a, b, c in triangles if a == b or b == c),
+        "duplicate":    num_triangles - len(set(triangles)),
+    }